@@ -6,15 +6,25 @@ This module contains the core conversation memory functionality
 shared between the FastMCP server and standalone implementations.
 """
 
+import asyncio
+import bisect
+import heapq
 import json
 import logging
+import mmap
+import os
 import re
-import uuid
-from datetime import datetime, timedelta
+import secrets
+import threading
+from collections import Counter
+from collections.abc import Collection
+from datetime import date, datetime, timedelta
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
 import aiofiles
+import orjson
 
 # Plain absolute import: ``src/`` is always a direct sys.path entry (see
 # server_fastmcp.py for the full explanation), so no relative-import
@@ -22,7 +32,7 @@ import aiofiles
 # genuine possible failure -- SearchDatabase needs stdlib ``sqlite3``,
 # which some minimal Python builds omit -- not a dual-style redefinition.
 try:
-    from search_database import SearchDatabase
+    from search_database import ADD_CONVERSATIONS_BATCH_SIZE, SearchDatabase
 
     SQLITE_AVAILABLE = True
 except ImportError:
@@ -31,8 +41,149 @@ except ImportError:
 # Plain absolute import, matching the ``search_database`` import above and
 # validators.py's own header comment: ``src/`` is always a direct sys.path
 # entry, so no relative-import fallback is needed here.
+from term_matching import build_term_automaton, find_terms
 from validators import validate_storage_path
 
+# Below this size a plain read() beats mmap: the map/unmap syscalls and page
+# table setup cost more than copying a few KB into a bytes object.
+_MMAP_THRESHOLD = 64 * 1024
+
+# Number of contiguous shards the linear search fallback splits the index
+# into. Each shard is read and scored synchronously on one default-executor
+# thread (sized the same way), so file reads overlap without paying an
+# executor round trip per open/read/close as aiofiles does.
+_SEARCH_SHARDS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def _load_json_file(file_path: Path) -> Any:
+    """Parse a JSON file with orjson, mmap-ing it when it's large enough.
+
+    Used on the per-conversation read paths (search, preview, weekly summary)
+    where parse throughput dominates. Raises OSError / ValueError like
+    ``json.load`` does (``orjson.JSONDecodeError`` subclasses ValueError), so
+    callers' existing except clauses keep working.
+    """
+    with open(file_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+        with (
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+            memoryview(mm) as view,
+        ):
+            return orjson.loads(view)
+
+
+# Conversation files stay indented for anyone reading them by hand; this
+# matches the json.dumps(indent=2, ensure_ascii=False) layout they had, and
+# OPT_NON_STR_KEYS keeps json's handling of e.g. int keys in custom_fields.
+_CONVERSATION_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# get_preview returns this many leading characters of a conversation.
+_PREVIEW_CHARS = 500
+
+# index.json entries store this many, which is what topic search shows.
+_INDEX_PREVIEW_CHARS = 200
+
+
+def _content_preview(content: str, chars: int = _PREVIEW_CHARS) -> str:
+    """Return the first ``chars`` characters of ``content``, marking a cut with "..."."""
+    return content[:chars] + "..." if len(content) > chars else content
+
+
+# Keyword vocabulary for _extract_topics. A tuple so it's built once at import
+# rather than re-allocated as a list literal on every call.
+_TECH_TERMS = (
+    "python",
+    "javascript",
+    "java",
+    "css",
+    "html",
+    "react",
+    "vue",
+    "angular",
+    "django",
+    "flask",
+    "nodejs",
+    "express",
+    "api",
+    "database",
+    "sql",
+    "mongodb",
+    "docker",
+    "kubernetes",
+    "aws",
+    "azure",
+    "gcp",
+    "git",
+    "github",
+    "gitlab",
+    "testing",
+    "debugging",
+    "deployment",
+    "authentication",
+    "security",
+    "encryption",
+    "machine learning",
+    "ai",
+    "neural network",
+    "data science",
+    "analytics",
+    "frontend",
+    "backend",
+    "fullstack",
+    "devops",
+    "cicd",
+    "microservices",
+    "rest",
+    "graphql",
+    "websocket",
+    "json",
+    "xml",
+    "yaml",
+    "markdown",
+    "linux",
+    "windows",
+    "macos",
+    "bash",
+    "powershell",
+    "terminal",
+    "cli",
+    "performance",
+    "optimization",
+    "scalability",
+    "architecture",
+    "design patterns",
+    "agile",
+    "scrum",
+    "kanban",
+    "project management",
+    "code review",
+)
+
+
+# One pass over the content finds every (overlapping) occurrence of every
+# term, instead of ~65 separate substring scans. Overlaps matter: "java"
+# inside "javascript" must still count, exactly like ``"java" in text``.
+_TECH_TERMS_AUTOMATON = build_term_automaton(_TECH_TERMS)
+
+
+# Quoted phrases are treated as likely-important concepts.
+_DOUBLE_QUOTED_RE = re.compile(r'"([^"]+)"')
+_SINGLE_QUOTED_RE = re.compile(r"'([^']+)'")
+
+# Capitalized words that might be technologies/frameworks. The trailing
+# (?:[A-Z][a-zA-Z]*)* group this pattern used to carry was redundant --
+# [a-zA-Z]* already matches uppercase -- but it made the two halves
+# ambiguous, so input like "AAAA...1" (a hex digest, base64 blob, or CONST_2)
+# backtracked exponentially. Same matches, linear time.
+_CAPITALIZED_WORD_RE = re.compile(r"\b[A-Z][a-zA-Z]*\b")
+
+# Sentence-initial words that the capitalized-word pattern picks up but that
+# never name a topic.
+_CAPITALIZED_STOPWORDS = frozenset({"The", "This", "That", "When", "Where", "How", "What", "Why"})
+
+_MAX_TOPICS = 10
+
 
 class ConversationMemoryServer:
     def __init__(
@@ -67,6 +218,13 @@ class ConversationMemoryServer:
         self.index_file = self.conversations_path / "index.json"
         self.topics_file = self.conversations_path / "topics.json"
 
+        # Parsed index.json/topics.json: path -> (_stat_key(path), data).
+        # See _read_json_cached.
+        self._json_cache: dict[Path, tuple[tuple[int, int, int], Any]] = {}
+        # index.json entries ordered by conversation day, for one version of
+        # the cached index. See _index_by_day.
+        self._day_index: tuple[Any, list[date], list[int]] | None = None
+
         # Initialize logger
         self.logger = logging.getLogger(__name__)
 
@@ -95,6 +253,18 @@ class ConversationMemoryServer:
         # Sync index.json with conversation files on disk
         self._sync_index_from_files()
 
+        # Bring search.db up to date with index.json (first run over an
+        # existing JSON store, or search.db deleted/rebuilt) in the
+        # background. Every method that reads or writes search.db awaits
+        # _wait_for_search_db_sync first, so the backfill never contends
+        # with a save or overwrites a newer row with a stale one.
+        self._search_db_sync_thread: threading.Thread | None = None
+        if self.use_sqlite_search:
+            self._search_db_sync_thread = threading.Thread(
+                target=self._sync_search_db_from_index, name="search-db-sync", daemon=True
+            )
+            self._search_db_sync_thread.start()
+
     def _detect_data_directory_structure(self) -> bool:
         """
         Auto-detect whether to use new data/ structure or legacy structure.
@@ -133,13 +303,70 @@ class ConversationMemoryServer:
                     f,
                 )
 
+    @staticmethod
+    def _stat_key(path: Path) -> tuple[int, int, int]:
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+    def _read_json_cached(self, path: Path) -> Any:
+        """Return the parsed JSON in ``path``, re-reading it only if it changed.
+
+        Used for index.json and topics.json, which every search, preview and
+        add would otherwise re-parse. Freshness is checked with a stat
+        (mtime, ctime, size), so edits by another process -- and permission
+        changes, which only touch ctime -- are still picked up.
+        The returned object is shared: callers that modify it must persist
+        it with _write_json_cached, or drop it with _invalidate_json_cache
+        if they bail out part way.
+        """
+        key = self._stat_key(path)
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        data = _load_json_file(path)
+        self._json_cache[path] = (key, data)
+        return data
+
+    async def _read_json_cached_async(self, path: Path) -> Any:
+        """Async variant of _read_json_cached; a miss reads via aiofiles."""
+        key = self._stat_key(path)
+        cached = self._json_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        async with aiofiles.open(path, "rb") as f:
+            data = orjson.loads(await f.read())
+        self._json_cache[path] = (key, data)
+        return data
+
+    def _write_json_cached(self, path: Path, data: Any) -> None:
+        """Write ``data`` to ``path`` and keep it as the cached copy.
+
+        Serialized compactly with orjson rather than ``json.dump(indent=2)``,
+        whose indenting encoder is pure Python -- for a large index that was
+        most of the cost of every add. These files are internal, so they
+        skip indentation. Output is UTF-8, and the bytes are built before
+        the file is opened, so an unserializable value no longer leaves a
+        truncated file behind.
+        """
+        try:
+            payload = orjson.dumps(data)
+            with open(path, "wb") as f:
+                f.write(payload)
+        except BaseException:
+            self._invalidate_json_cache(path)
+            raise
+        self._json_cache[path] = (self._stat_key(path), data)
+
+    def _invalidate_json_cache(self, path: Path) -> None:
+        self._json_cache.pop(path, None)
+
     def _sync_index_from_files(self):
         """Rebuild index.json from conversation files on disk if out of sync."""
         try:
-            with open(self.index_file) as f:
-                index_data = json.load(f)
+            index_data = self._read_json_cached(self.index_file)
             indexed_ids = {c["id"] for c in index_data.get("conversations", [])}
         except (OSError, ValueError, KeyError, TypeError):
+            self._invalidate_json_cache(self.index_file)
             indexed_ids = set()
             index_data = {
                 "conversations": [],
@@ -152,10 +379,10 @@ class ConversationMemoryServer:
             return  # Already in sync or no files to add
 
         added = 0
+        now_iso = datetime.now().isoformat()
         for conv_file in conv_files:
             try:
-                with open(conv_file, encoding="utf-8") as f:
-                    conv_data = json.load(f)
+                conv_data = _load_json_file(conv_file)
                 conv_id = conv_data.get("id", "")
                 if conv_id and conv_id not in indexed_ids:
                     relative_path = conv_file.relative_to(self.storage_path)
@@ -166,7 +393,10 @@ class ConversationMemoryServer:
                             "date": conv_data.get("date", ""),
                             "topics": conv_data.get("topics", []),
                             "file_path": str(relative_path),
-                            "added_at": conv_data.get("created_at", datetime.now().isoformat()),
+                            "added_at": conv_data.get("created_at", now_iso),
+                            "preview": _content_preview(
+                                conv_data.get("content", ""), _INDEX_PREVIEW_CHARS
+                            ),
                         }
                     )
                     indexed_ids.add(conv_id)
@@ -175,13 +405,96 @@ class ConversationMemoryServer:
                 continue
 
         if added > 0:
-            index_data["last_updated"] = datetime.now().isoformat()
-            with open(self.index_file, "w") as f:
-                json.dump(index_data, f, indent=2)
+            index_data["last_updated"] = now_iso
+            self._write_json_cached(self.index_file, index_data)
             self.logger.info(
                 f"Synced index.json: added {added} conversations ({len(indexed_ids)} total)"
             )
 
+    def _sync_search_db_from_index(self):
+        """Add conversations listed in index.json but missing from search.db.
+
+        The JSON files stay canonical; this is the one-shot bootstrap that
+        lets FTS5 serve every query instead of falling back to reading each
+        conversation file. Steady state costs one ``SELECT id`` at startup.
+        Conversations that can't be added are recorded in search.db with a
+        stamp of their file and skipped until that file changes.
+
+        Runs on the search-db-sync thread, so it reads index.json directly
+        rather than through _json_cache, which only the event loop touches.
+        """
+        try:
+            conversations = _load_json_file(self.index_file).get("conversations", [])
+        except (OSError, ValueError, AttributeError):
+            return
+
+        db_ids = self.search_db.get_conversation_ids()
+        missing = [c for c in conversations if c.get("id") and c["id"] not in db_ids]
+        if not missing:
+            return
+
+        known_failures = self.search_db.get_sync_failures()
+        failures = {}
+        added = skipped = 0
+        batch = []
+        batch_stamps = []
+
+        def flush():
+            nonlocal added
+            results = self.search_db.add_conversations(batch)
+            for (conv_id, stamp), ok in zip(batch_stamps, results, strict=True):
+                if ok:
+                    added += 1
+                else:
+                    failures[conv_id] = stamp
+            batch.clear()
+            batch_stamps.clear()
+
+        for conv_info in missing:
+            conv_id = conv_info["id"]
+            stamp = self._file_stamp(conv_info)
+            if known_failures.get(conv_id) == stamp:
+                failures[conv_id] = stamp
+                skipped += 1
+                continue
+            try:
+                conv_data = _load_json_file(self.storage_path / conv_info["file_path"])
+                conv_data.setdefault("created_at", conv_info.get("added_at", conv_data["date"]))
+                batch.append((conv_data, conv_info["file_path"]))
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                failures[conv_id] = stamp
+                continue
+            batch_stamps.append((conv_id, stamp))
+            if len(batch) >= ADD_CONVERSATIONS_BATCH_SIZE:
+                flush()
+        if batch:
+            flush()
+
+        if failures != known_failures:
+            self.search_db.set_sync_failures(failures)
+        if len(missing) > skipped:
+            self.logger.info(
+                f"Synced search.db: added {added} of {len(missing) - skipped} missing conversations"
+            )
+        if failures:
+            self.logger.debug(f"search.db sync: {len(failures)} conversations can't be added")
+
+    def _file_stamp(self, conv_info: dict[str, Any]) -> str:
+        """Identify the current version of an index entry's file ("" if it's gone)."""
+        try:
+            return ":".join(map(str, self._stat_key(self.storage_path / conv_info["file_path"])))
+        except (OSError, KeyError, TypeError):
+            return ""
+
+    async def _wait_for_search_db_sync(self) -> None:
+        """Wait for the startup search.db backfill if it's still running.
+
+        Joined off the event loop, so other requests keep being served.
+        """
+        thread = self._search_db_sync_thread
+        if thread is not None and thread.is_alive():
+            await asyncio.to_thread(thread.join)
+
     def _get_date_folder(self, date: datetime) -> Path:
         """Get the folder path for a given date"""
         year_folder = self.conversations_path / str(date.year)
@@ -191,118 +504,40 @@ class ConversationMemoryServer:
 
     def _extract_topics(self, content: str) -> list[str]:
         """Extract topics from conversation content using simple keyword extraction"""
-        common_tech_terms = [
-            "python",
-            "javascript",
-            "java",
-            "css",
-            "html",
-            "react",
-            "vue",
-            "angular",
-            "django",
-            "flask",
-            "nodejs",
-            "express",
-            "api",
-            "database",
-            "sql",
-            "mongodb",
-            "docker",
-            "kubernetes",
-            "aws",
-            "azure",
-            "gcp",
-            "git",
-            "github",
-            "gitlab",
-            "testing",
-            "debugging",
-            "deployment",
-            "authentication",
-            "security",
-            "encryption",
-            "machine learning",
-            "ai",
-            "neural network",
-            "data science",
-            "analytics",
-            "frontend",
-            "backend",
-            "fullstack",
-            "devops",
-            "cicd",
-            "microservices",
-            "rest",
-            "graphql",
-            "websocket",
-            "json",
-            "xml",
-            "yaml",
-            "markdown",
-            "linux",
-            "windows",
-            "macos",
-            "bash",
-            "powershell",
-            "terminal",
-            "cli",
-            "performance",
-            "optimization",
-            "scalability",
-            "architecture",
-            "design patterns",
-            "agile",
-            "scrum",
-            "kanban",
-            "project management",
-            "code review",
-        ]
-
         # Convert to lowercase for matching
         content_lower = content.lower()
 
-        # Find quoted terms (likely important concepts)
-        quoted_terms = re.findall(r'"([^"]+)"', content)
-        quoted_terms.extend(re.findall(r"'([^']+)'", content))
-
         # Find technical terms
-        found_topics = []
-        for term in common_tech_terms:
-            if term in content_lower:
-                found_topics.append(term)
-
-        # Add quoted terms (filtered for reasonable length)
-        for term in quoted_terms:
-            if len(term) > 2 and len(term) < 50 and term.lower() not in found_topics:
-                found_topics.append(term.lower())
-
-        # Find capitalized words that might be technologies/frameworks.
-        # The trailing (?:[A-Z][a-zA-Z]*)* group this pattern used to carry was
-        # redundant -- [a-zA-Z]* already matches uppercase -- but it made the
-        # two halves ambiguous, so input like "AAAA...1" (a hex digest, base64
-        # blob, or CONST_2) backtracked exponentially. Same matches, linear time.
-        tech_pattern = r"\b[A-Z][a-zA-Z]*\b"
-        capitalized_words = re.findall(tech_pattern, content)
-        for word in capitalized_words:
-            if (
-                len(word) > 2
-                and word.lower() not in found_topics
-                and word
-                not in [
-                    "The",
-                    "This",
-                    "That",
-                    "When",
-                    "Where",
-                    "How",
-                    "What",
-                    "Why",
-                ]
-            ):
-                found_topics.append(word.lower())
-
-        return found_topics[:10]  # Limit to top 10 topics
+        found_topics = find_terms(content_lower, _TECH_TERMS, _TECH_TERMS_AUTOMATON)
+        seen = set(found_topics)
+
+        if len(found_topics) >= _MAX_TOPICS:
+            return found_topics[:_MAX_TOPICS]
+
+        # Then quoted terms (filtered for reasonable length), then capitalized
+        # words. These are lazy finditer scans: only the first _MAX_TOPICS
+        # topics are kept, so on long content they stop as soon as the list
+        # is full instead of collecting every match in the document.
+        quoted_terms = (
+            match[1]
+            for pattern in (_DOUBLE_QUOTED_RE, _SINGLE_QUOTED_RE)
+            for match in pattern.finditer(content)
+            if 2 < len(match[1]) < 50
+        )
+        capitalized_words = (
+            match[0]
+            for match in _CAPITALIZED_WORD_RE.finditer(content)
+            if len(match[0]) > 2 and match[0] not in _CAPITALIZED_STOPWORDS
+        )
+        for term in chain(quoted_terms, capitalized_words):
+            term_lower = term.lower()
+            if term_lower not in seen:
+                found_topics.append(term_lower)
+                seen.add(term_lower)
+                if len(found_topics) == _MAX_TOPICS:
+                    break
+
+        return found_topics
 
     async def add_conversation(
         self,
@@ -325,15 +560,18 @@ class ConversationMemoryServer:
         conversation JSON plus indexed in the SQLite FTS database when
         available.
         """
+        await self._wait_for_search_db_sync()
         try:
+            now = datetime.now()
+
             # Parse date or use current
             if conversation_date:
                 try:
                     date = datetime.fromisoformat(conversation_date.replace("Z", "+00:00"))
                 except ValueError:
-                    date = datetime.now()
+                    date = now
             else:
-                date = datetime.now()
+                date = now
 
             # Generate title if not provided
             if not title:
@@ -343,7 +581,7 @@ class ConversationMemoryServer:
                 title = first_line[:50] + "..." if len(first_line) > 50 else first_line
 
             # Create conversation record
-            conversation_id = f"conv_{date.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+            conversation_id = f"conv_{date.strftime('%Y%m%d_%H%M%S')}_{secrets.token_hex(4)}"
 
             date_folder = self._get_date_folder(date)
             file_path = date_folder / f"{conversation_id}.json"
@@ -357,7 +595,7 @@ class ConversationMemoryServer:
                 "content": content,
                 "date": date.isoformat(),
                 "topics": topics,
-                "created_at": datetime.now().isoformat(),
+                "created_at": now.isoformat(),
             }
 
             # Only persist metadata keys when non-empty so legacy JSON files
@@ -374,8 +612,9 @@ class ConversationMemoryServer:
                 conversation_data["custom_fields"] = dict(custom_fields)
 
             # Save conversation file
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(conversation_data, indent=2, ensure_ascii=False))
+            payload = orjson.dumps(conversation_data, option=_CONVERSATION_JSON_OPTIONS)
+            async with aiofiles.open(file_path, "wb") as f:
+                await f.write(payload)
 
             # Update index
             self._update_index(conversation_data, file_path)
@@ -440,18 +679,17 @@ class ConversationMemoryServer:
     def _remove_index_entry(self, conversation_id: str) -> None:
         """Remove a conversation's entry from index.json (rollback helper)."""
         try:
-            with open(self.index_file) as f:
-                index_data = json.load(f)
+            index_data = self._read_json_cached(self.index_file)
 
             index_data["conversations"] = [
                 c for c in index_data.get("conversations", []) if c.get("id") != conversation_id
             ]
             index_data["last_updated"] = datetime.now().isoformat()
 
-            with open(self.index_file, "w") as f:
-                json.dump(index_data, f, indent=2)
+            self._write_json_cached(self.index_file, index_data)
 
         except (OSError, ValueError, KeyError, TypeError) as e:
+            self._invalidate_json_cache(self.index_file)
             self.logger.exception(f"Rollback: failed to remove index entry: {e}")
 
     _CONVERSATION_ID_RE = re.compile(r"^conv_(\d{8})_(\d{6})_[\w]+$")
@@ -500,6 +738,7 @@ class ConversationMemoryServer:
         ``{"status": "error", "message": ...}`` on failure (malformed ID,
         missing file, no-op call, conflicting tag ops, I/O error).
         """
+        await self._wait_for_search_db_sync()
         if set_tags is not None and (add_tags or remove_tags):
             return {
                 "status": "error",
@@ -568,8 +807,10 @@ class ConversationMemoryServer:
                 "message": "No changes provided",
             }
 
-        # Compose blockchain-style audit line and prepend to content.
-        timestamp = datetime.now().isoformat(timespec="seconds")
+        # Compose blockchain-style audit line and prepend to content. The
+        # audit timestamp and updated_at come from the same clock reading.
+        now = datetime.now()
+        timestamp = now.isoformat(timespec="seconds")
         note = change_note if change_note else "; ".join(changes) or "no-op"
         audit_line = f"[update {timestamp} — {note}]"
         body = conversation_data.get("content", "")
@@ -579,11 +820,12 @@ class ConversationMemoryServer:
         old_topics = list(conversation_data.get("topics") or [])
         new_topics = self._extract_topics(conversation_data["content"])
         conversation_data["topics"] = new_topics
-        conversation_data["updated_at"] = datetime.now().isoformat()
+        conversation_data["updated_at"] = now.isoformat()
 
         try:
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(conversation_data, indent=2, ensure_ascii=False))
+            payload = orjson.dumps(conversation_data, option=_CONVERSATION_JSON_OPTIONS)
+            async with aiofiles.open(file_path, "wb") as f:
+                await f.write(payload)
         except OSError as e:
             return {
                 "status": "error",
@@ -650,17 +892,18 @@ class ConversationMemoryServer:
     def _replace_index_entry(self, conversation_data: dict, file_path: Path):
         """Replace (or insert) the index.json entry for a conversation."""
         try:
-            with open(self.index_file) as f:
-                index_data = json.load(f)
+            index_data = self._read_json_cached(self.index_file)
 
             relative_path = file_path.relative_to(self.storage_path)
+            now_iso = datetime.now().isoformat()
             new_entry = {
                 "id": conversation_data["id"],
                 "title": conversation_data["title"],
                 "date": conversation_data["date"],
                 "topics": conversation_data["topics"],
                 "file_path": str(relative_path),
-                "added_at": datetime.now().isoformat(),
+                "added_at": now_iso,
+                "preview": _content_preview(conversation_data["content"], _INDEX_PREVIEW_CHARS),
             }
 
             conversations = index_data.get("conversations", [])
@@ -678,12 +921,12 @@ class ConversationMemoryServer:
                 conversations.append(new_entry)
 
             index_data["conversations"] = conversations
-            index_data["last_updated"] = datetime.now().isoformat()
+            index_data["last_updated"] = now_iso
 
-            with open(self.index_file, "w") as f:
-                json.dump(index_data, f, indent=2)
+            self._write_json_cached(self.index_file, index_data)
 
         except (OSError, ValueError, KeyError, TypeError) as e:
+            self._invalidate_json_cache(self.index_file)
             self.logger.exception(f"Error replacing index entry: {e}")
 
     def _resync_topics_index(
@@ -697,8 +940,7 @@ class ConversationMemoryServer:
         Topics still present after the update are left untouched so we don't
         churn ``added_at`` timestamps."""
         try:
-            with open(self.topics_file) as f:
-                topics_data = json.load(f)
+            topics_data = self._read_json_cached(self.topics_file)
         except (OSError, ValueError) as e:
             self.logger.exception(f"Error loading topics index: {e}")
             return
@@ -721,6 +963,7 @@ class ConversationMemoryServer:
             if not topics_index[topic]:
                 del topics_index[topic]
 
+        now_iso = datetime.now().isoformat()
         for topic in added:
             existing = topics_index.get(topic)
             if not isinstance(existing, list):
@@ -728,16 +971,15 @@ class ConversationMemoryServer:
             topics_index[topic].append(
                 {
                     "conversation_id": conversation_id,
-                    "added_at": datetime.now().isoformat(),
+                    "added_at": now_iso,
                 }
             )
 
         topics_data["topics"] = topics_index
-        topics_data["last_updated"] = datetime.now().isoformat()
+        topics_data["last_updated"] = now_iso
 
         try:
-            with open(self.topics_file, "w") as f:
-                json.dump(topics_data, f, indent=2)
+            self._write_json_cached(self.topics_file, topics_data)
         except OSError as e:
             self.logger.exception(f"Error writing topics index: {e}")
 
@@ -746,7 +988,7 @@ class ConversationMemoryServer:
         query_terms: list[str],
         content: str,
         title: str,
-        topics: list[str],
+        topics: Collection[str],
     ) -> int:
         """Calculate relevance score for a conversation based on query terms"""
         score = 0
@@ -757,22 +999,27 @@ class ConversationMemoryServer:
                 score += 5
         return score
 
-    async def _process_conversation_for_search(
+    def _search_shard(self, conversations: list[dict], query_terms: list[str]) -> list[dict]:
+        """Score one shard of index entries, keeping matches in index order"""
+        results = []
+        for conv_info in conversations:
+            result = self._process_conversation_for_search(conv_info, query_terms)
+            if result:
+                results.append(result)
+        return results
+
+    def _process_conversation_for_search(
         self, conv_info: dict, query_terms: list[str]
     ) -> dict | None:
         """Process a single conversation for search results"""
         try:
-            file_path = self.storage_path / conv_info["file_path"]
-            if not file_path.exists():
-                return None
-
-            async with aiofiles.open(file_path, encoding="utf-8") as f:
-                content = await f.read()
-                conv_data = json.loads(content)
+            # No exists() pre-check: a missing file raises FileNotFoundError,
+            # which the OSError handler below turns into "no result"
+            conv_data = _load_json_file(self.storage_path / conv_info["file_path"])
 
             content = conv_data.get("content", "").lower()
             title = conv_data.get("title", "").lower()
-            topics = [t.lower() for t in conv_data.get("topics", [])]
+            topics = {t.lower() for t in conv_data.get("topics", [])}
 
             score = self._calculate_search_score(query_terms, content, title, topics)
 
@@ -794,6 +1041,7 @@ class ConversationMemoryServer:
         """Search conversations by content and topics"""
         # Use SQLite FTS search if available and enabled
         if self.use_sqlite_search and self.search_db:
+            await self._wait_for_search_db_sync()
             try:
                 return self.search_db.search_conversations(query, limit)
             except Exception as e:  # noqa: BLE001 - documented fallback: SQLite search failure falls through to linear search below
@@ -802,23 +1050,27 @@ class ConversationMemoryServer:
 
         # Fallback to linear search through JSON files
         try:
-            # Load index
-            async with aiofiles.open(self.index_file) as f:
-                content = await f.read()
-                index_data = json.loads(content)
-
+            index_data = await self._read_json_cached_async(self.index_file)
             conversations = index_data.get("conversations", [])
             query_terms = query.lower().split()
 
-            results = []
-            for conv_info in conversations:
-                result = await self._process_conversation_for_search(conv_info, query_terms)
-                if result:
-                    results.append(result)
+            # Score contiguous shards on worker threads so the event loop
+            # stays free and file reads overlap. gather returns the shards in
+            # order, so concatenating them keeps index order.
+            shard_size = max(1, -(-len(conversations) // _SEARCH_SHARDS))
+            shards = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self._search_shard, conversations[i : i + shard_size], query_terms
+                    )
+                    for i in range(0, len(conversations), shard_size)
+                )
+            )
+            results = list(chain.from_iterable(shards))
 
-            # Sort by score and return top results
-            results.sort(key=lambda x: x["score"], reverse=True)
-            return results[:limit]
+            # Top results by score; nlargest is a stable partial sort, so
+            # ties keep index order exactly as a full sort would
+            return heapq.nlargest(limit, results, key=lambda x: x["score"])
 
         except (OSError, ValueError, KeyError, TypeError) as e:
             return [{"error": f"Search failed: {str(e)}"}]
@@ -829,20 +1081,32 @@ class ConversationMemoryServer:
             with open(file_path, encoding="utf-8") as f:
                 content = f.read()
 
-            lines = content.split("\n")
-            preview_lines = []
-
-            for i, line in enumerate(lines):
-                line_lower = line.lower()
-                if any(term in line_lower for term in query_terms):
-                    # Include context lines around the match
-                    start = max(0, i - 2)
-                    end = min(len(lines), i + 3)
-                    context = lines[start:end]
-                    preview_lines.extend(context)
+            # Find the first matching line with one lowercase copy and C-level
+            # finds instead of splitting the file into a list of lines and
+            # lowercasing each. Terms are matched within a line, so one
+            # containing a newline can never match.
+            content_lower = content.lower()
+            hits = [content_lower.find(t) for t in query_terms if "\n" not in t]
+            hits = [pos for pos in hits if pos >= 0]
+            if not hits:
+                return ""
+
+            # lower() can change string length but never adds or removes
+            # newlines, so the line number carries over to ``content``
+            hit_line = content_lower.count("\n", 0, min(hits))
+
+            # Include context lines around the match: two before, two after
+            start = 0
+            for _ in range(max(0, hit_line - 2)):
+                start = content.index("\n", start) + 1
+            end = start
+            for _ in range(min(hit_line, 2) + 3):
+                end = content.find("\n", end) + 1
+                if end == 0:
+                    end = len(content) + 1
                     break
 
-            preview = "\n".join(preview_lines[:10])  # Limit preview length
+            preview = content[start : end - 1]
             return preview[:500] + "..." if len(preview) > 500 else preview
 
         except (OSError, ValueError, KeyError, TypeError):
@@ -852,24 +1116,26 @@ class ConversationMemoryServer:
         """Get a preview of a specific conversation"""
         try:
             # Load index to find the conversation
-            with open(self.index_file) as f:
-                index_data = json.load(f)
-
+            index_data = self._read_json_cached(self.index_file)
             conversations = index_data.get("conversations", [])
 
             for conv_info in conversations:
                 if conv_info["id"] == conversation_id:
                     file_path = self.storage_path / conv_info["file_path"]
 
-                    if file_path.exists():
-                        with open(file_path, encoding="utf-8") as f:
-                            conv_data = json.load(f)
-
-                        content = conv_data.get("content", "")
-                        return content[:500] + "..." if len(content) > 500 else content
-                    else:
+                    if not file_path.exists():
                         return "Conversation file not found"
 
+                    # The indexed preview is the whole conversation when it
+                    # wasn't cut short; otherwise (or for entries written
+                    # before previews were indexed) read the file
+                    preview = conv_info.get("preview")
+                    if preview is not None and len(preview) <= _INDEX_PREVIEW_CHARS:
+                        return preview
+
+                    conv_data = _load_json_file(file_path)
+                    return _content_preview(conv_data.get("content", ""))
+
             return "Conversation not found"
 
         except (OSError, ValueError, KeyError, TypeError) as e:
@@ -879,38 +1145,39 @@ class ConversationMemoryServer:
         """Update the main index with new conversation"""
         try:
             # Load existing index
-            with open(self.index_file) as f:
-                index_data = json.load(f)
+            index_data = self._read_json_cached(self.index_file)
 
             # Add new conversation to index
             relative_path = file_path.relative_to(self.storage_path)
+            now_iso = datetime.now().isoformat()
             conv_entry = {
                 "id": conversation_data["id"],
                 "title": conversation_data["title"],
                 "date": conversation_data["date"],
                 "topics": conversation_data["topics"],
                 "file_path": str(relative_path),
-                "added_at": datetime.now().isoformat(),
+                "added_at": now_iso,
+                "preview": _content_preview(conversation_data["content"], _INDEX_PREVIEW_CHARS),
             }
 
             index_data["conversations"].append(conv_entry)
-            index_data["last_updated"] = datetime.now().isoformat()
+            index_data["last_updated"] = now_iso
 
             # Save updated index
-            with open(self.index_file, "w") as f:
-                json.dump(index_data, f, indent=2)
+            self._write_json_cached(self.index_file, index_data)
 
         except (OSError, ValueError, KeyError, TypeError) as e:
+            self._invalidate_json_cache(self.index_file)
             self.logger.exception(f"Error updating index: {e}")
 
     def _update_topics_index(self, topics: list[str], conversation_id: str):
         """Update the topics index with new conversation topics"""
         try:
             # Load existing topics index
-            with open(self.topics_file) as f:
-                topics_data = json.load(f)
+            topics_data = self._read_json_cached(self.topics_file)
 
             topics_index = topics_data.get("topics", {})
+            now_iso = datetime.now().isoformat()
 
             # Add conversation to each topic
             for topic in topics:
@@ -922,18 +1189,18 @@ class ConversationMemoryServer:
                 topics_index[topic].append(
                     {
                         "conversation_id": conversation_id,
-                        "added_at": datetime.now().isoformat(),
+                        "added_at": now_iso,
                     }
                 )
 
             topics_data["topics"] = topics_index
-            topics_data["last_updated"] = datetime.now().isoformat()
+            topics_data["last_updated"] = now_iso
 
             # Save updated topics index
-            with open(self.topics_file, "w") as f:
-                json.dump(topics_data, f, indent=2)
+            self._write_json_cached(self.topics_file, topics_data)
 
         except (OSError, ValueError, KeyError, TypeError) as e:
+            self._invalidate_json_cache(self.topics_file)
             self.logger.exception(f"Error updating topics index: {e}")
 
     async def generate_weekly_summary(self, week_offset: int = 0) -> str:
@@ -943,7 +1210,10 @@ class ConversationMemoryServer:
             start_of_week = today - timedelta(days=today.weekday() + (week_offset * 7))
             end_of_week = start_of_week + timedelta(days=6)
 
-            week_conversations = self._get_week_conversations(start_of_week, end_of_week)
+            # Reads every conversation file in the week; keep it off the event loop
+            week_conversations = await asyncio.to_thread(
+                self._get_week_conversations, start_of_week, end_of_week
+            )
             if not week_conversations:
                 if week_offset == 0:
                     return (
@@ -974,35 +1244,62 @@ class ConversationMemoryServer:
     def _get_week_conversations(self, start_of_week: datetime, end_of_week: datetime) -> list[dict]:
         """Return conversations for the given week range"""
         try:
-            with open(self.index_file) as f:
-                index_data = json.load(f)
+            index_data = self._read_json_cached(self.index_file)
             conversations = index_data.get("conversations", [])
         except (OSError, ValueError, KeyError, TypeError):
             return []
 
+        days, positions = self._index_by_day(conversations)
+        lo = bisect.bisect_left(days, start_of_week.date())
+        hi = bisect.bisect_right(days, end_of_week.date())
+
         week_conversations = []
-        for conv_info in conversations:
+        # Back to index order, which the summary lists conversations in
+        for pos in sorted(positions[lo:hi]):
+            conv_info = conversations[pos]
             try:
-                conv_date = datetime.fromisoformat(conv_info["date"].replace("Z", "+00:00"))
-                if start_of_week.date() <= conv_date.date() <= end_of_week.date():
-                    file_path = self.storage_path / conv_info["file_path"]
-                    if file_path.exists():
-                        try:
-                            with open(file_path, encoding="utf-8") as f:
-                                conv_data = json.load(f)
-                            week_conversations.append(conv_data)
-                        except (OSError, ValueError, KeyError, TypeError):
-                            week_conversations.append(
-                                {
-                                    "title": conv_info.get("title", "Untitled"),
-                                    "date": conv_info["date"],
-                                    "topics": conv_info.get("topics", []),
-                                }
-                            )
+                file_path = self.storage_path / conv_info["file_path"]
+                if not file_path.exists():
+                    continue
             except (ValueError, KeyError, TypeError):
                 continue
+            try:
+                week_conversations.append(_load_json_file(file_path))
+            except (OSError, ValueError, KeyError, TypeError):
+                week_conversations.append(
+                    {
+                        "title": conv_info.get("title", "Untitled"),
+                        "date": conv_info["date"],
+                        "topics": conv_info.get("topics", []),
+                    }
+                )
         return week_conversations
 
+    def _index_by_day(self, conversations: list[dict]) -> tuple[list[date], list[int]]:
+        """Return (days, positions): index entries sorted by conversation day.
+
+        ``days[i]`` is the calendar date of ``conversations[positions[i]]``;
+        entries whose date doesn't parse are left out. Built once per
+        version of index.json (``conversations`` must be the list just
+        returned by _read_json_cached), so repeated weekly summaries bisect
+        instead of re-parsing every entry's date.
+        """
+        # Weekly summaries run on a worker thread, so a write on the event
+        # loop may have replaced or dropped the cache entry since the read
+        cached = self._json_cache.get(self.index_file)
+        key = (cached and cached[0], id(conversations), len(conversations))
+        if cached is None or self._day_index is None or self._day_index[0] != key:
+            dated = []
+            for pos, conv_info in enumerate(conversations):
+                try:
+                    conv_date = datetime.fromisoformat(conv_info["date"].replace("Z", "+00:00"))
+                except (ValueError, KeyError, TypeError):
+                    continue
+                dated.append((conv_date.date(), pos))
+            dated.sort()
+            self._day_index = (key, [d for d, _ in dated], [pos for _, pos in dated])
+        return self._day_index[1], self._day_index[2]
+
     def _build_weekly_summary_text(
         self,
         start_of_week: datetime,
@@ -1017,33 +1314,34 @@ class ConversationMemoryServer:
         )
         summary_parts.append(f"\n## Overview\n- Total conversations: {len(week_conversations)}")
 
-        all_topics = []
-        for conv in week_conversations:
-            all_topics.extend(conv.get("topics", []))
-
-        topic_counts: dict[str, int] = {}
-        for topic in all_topics:
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
+        # One counting pass, no intermediate list of every topic. most_common
+        # is a stable sort, so ties keep first-seen order as before.
+        topic_counts = Counter(chain.from_iterable(c.get("topics", []) for c in week_conversations))
 
         if topic_counts:
             summary_parts.append("\n## Popular Topics")
-            sorted_topics = sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)
-            for topic, count in sorted_topics[:10]:
-                summary_parts.append(f"- {topic}: {count} conversations")
+            summary_parts.extend(
+                f"- {topic}: {count} conversations" for topic, count in topic_counts.most_common(10)
+            )
 
         summary_parts.append("\n## Conversations")
-        for conv in week_conversations:
-            date_str = conv.get("date", "").split("T")[0]
-            topics_str = ", ".join(conv.get("topics", [])[:3])
-            if len(conv.get("topics", [])) > 3:
-                topics_str += "..."
-            conv_line = f"- [{date_str}] {conv.get('title', 'Untitled')}"
-            if topics_str:
-                conv_line += f" *Topics: {topics_str}*"
-            summary_parts.append(conv_line)
+        summary_parts.extend(self._weekly_summary_line(conv) for conv in week_conversations)
 
         return "\n".join(summary_parts)
 
+    @staticmethod
+    def _weekly_summary_line(conv: dict) -> str:
+        """Format one conversation's bullet for the weekly summary"""
+        date_str = conv.get("date", "").split("T")[0]
+        topics = conv.get("topics", [])
+        topics_str = ", ".join(topics[:3])
+        if len(topics) > 3:
+            topics_str += "..."
+        conv_line = f"- [{date_str}] {conv.get('title', 'Untitled')}"
+        if topics_str:
+            conv_line += f" *Topics: {topics_str}*"
+        return conv_line
+
     async def get_search_stats(self) -> dict[str, Any]:
         """Get search engine statistics and status."""
         stats = {
@@ -1053,6 +1351,7 @@ class ConversationMemoryServer:
         }
 
         if self.use_sqlite_search and self.search_db:
+            await self._wait_for_search_db_sync()
             try:
                 db_stats = self.search_db.get_conversation_stats()
                 stats.update(db_stats)
@@ -1069,6 +1368,7 @@ class ConversationMemoryServer:
         if not self.use_sqlite_search:
             return {"error": "SQLite search not enabled"}
 
+        await self._wait_for_search_db_sync()
         try:
             from migrate_to_sqlite import ConversationMigrator
 
@@ -1088,6 +1388,7 @@ class ConversationMemoryServer:
     async def search_by_topic(self, topic: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search conversations by specific topic."""
         if self.use_sqlite_search and self.search_db:
+            await self._wait_for_search_db_sync()
             try:
                 return self.search_db.search_by_topic(topic, limit)
             except Exception as e:  # noqa: BLE001 - documented fallback: SQLite topic search failure falls through to JSON topic search
@@ -1104,6 +1405,7 @@ class ConversationMemoryServer:
         maintained in the JSON topic index.
         """
         if self.use_sqlite_search and self.search_db:
+            await self._wait_for_search_db_sync()
             try:
                 return self.search_db.search_by_tag(tag, limit)
             except Exception as e:  # noqa: BLE001 - MCP tool handler: report tag-search failure rather than crash the server (no JSON fallback exists)
@@ -1115,6 +1417,7 @@ class ConversationMemoryServer:
     async def search_by_session_id(self, session_id: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search conversations by session_id (D2 metadata field)."""
         if self.use_sqlite_search and self.search_db:
+            await self._wait_for_search_db_sync()
             try:
                 return self.search_db.search_by_session_id(session_id, limit)
             except Exception as e:  # noqa: BLE001 - MCP tool handler: report session-search failure rather than crash the server (no JSON fallback exists)
@@ -1128,6 +1431,7 @@ class ConversationMemoryServer:
     ) -> list[dict[str, Any]]:
         """Search conversations by conversation_type (D2 metadata field)."""
         if self.use_sqlite_search and self.search_db:
+            await self._wait_for_search_db_sync()
             try:
                 return self.search_db.search_by_conversation_type(conversation_type, limit)
             except Exception as e:  # noqa: BLE001 - MCP tool handler: report conversation-type-search failure rather than crash the server (no JSON fallback exists)
@@ -1139,9 +1443,7 @@ class ConversationMemoryServer:
     async def _search_topic_json(self, topic: str, limit: int) -> list[dict[str, Any]]:
         """Helper method for JSON-based topic search."""
         try:
-            async with aiofiles.open(self.topics_file) as f:
-                content = await f.read()
-                topics_data = json.loads(content)
+            topics_data = await self._read_json_cached_async(self.topics_file)
 
             topics_index = topics_data.get("topics", {})
             if topic not in topics_index:
@@ -1150,21 +1452,25 @@ class ConversationMemoryServer:
             # Get conversation IDs for this topic
             topic_convs = topics_index[topic]
 
-            # Load conversation details
+            # Load conversation details; index entries carry the preview, so
+            # only a stat is needed to skip conversations whose file is gone
+            index_data = await self._read_json_cached_async(self.index_file)
+            entries = {c.get("id"): c for c in index_data.get("conversations", [])}
             results = []
             for topic_conv in topic_convs[:limit]:
                 conv_id = topic_conv.get("conversation_id")
-                if conv_id:
-                    preview = self.get_preview(conv_id)
-                    if preview and "not found" not in preview.lower():
-                        results.append(
-                            {
-                                "id": conv_id,
-                                "preview": (
-                                    preview[:200] + "..." if len(preview) > 200 else preview
-                                ),
-                            }
-                        )
+                if conv_id and conv_id in entries:
+                    entry = entries[conv_id]
+                    if not (self.storage_path / entry["file_path"]).exists():
+                        continue
+                    preview = entry.get("preview")
+                    if preview is None:
+                        preview = self.get_preview(conv_id)
+                        if "not found" in preview.lower():
+                            continue
+                        preview = _content_preview(preview, _INDEX_PREVIEW_CHARS)
+                    if preview:
+                        results.append({"id": conv_id, "preview": preview})
 
             return results
 
@@ -9,14 +9,62 @@ from various AI assistants (ChatGPT, Cursor, Claude, etc.).
 import json
 import logging
 import re
+import time
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from term_matching import lowered_json
 from validators import validate_import_file_path
 
 logger = logging.getLogger(__name__)
 
+# Claude web conversation patterns; one match is enough to classify.
+_CLAUDE_WEB_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+    for pattern in (
+        r"\*\*Human\*\*:",
+        r"\*\*Claude\*\*:",
+        r"# Conversation with Claude",
+        r"Human:.*\n.*Claude:",
+    )
+)
+
+# Generic markdown conversation indicators; two or more must match.
+_MARKDOWN_CONVERSATION_PATTERNS = tuple(
+    re.compile(pattern, re.MULTILINE)
+    for pattern in (
+        r"\*\*.*\*\*:",  # Bold role indicators
+        r"^[A-Z][a-z]+:",  # Simple role indicators
+        r"^\s*>\s*",  # Quote blocks
+        r"#{1,3}\s*",  # Headers
+    )
+)
+
+# Text formats are classified from this many leading characters. Role
+# markers appear at the top of a conversation, so reading a whole
+# multi-megabyte dump just to pattern-match it buys nothing.
+_TEXT_DETECTION_PREFIX_CHARS = 64 * 1024
+
+# Top-level fields of our own stored conversations. Key sets like this are
+# matched with one C-level set operation against the parsed dict's keys.
+# This set and CONVERSATION_FIELDS are shared with ClaudeImporter, so the
+# detector and the importer classify a file the same way.
+CLAUDE_MEMORY_FIELDS = frozenset(("id", "title", "content", "date", "topics", "created_at"))
+
+# Top-level keys typical of a Cursor session export.
+_CURSOR_INDICATORS = frozenset(("session_id", "workspace", "interactions", "model"))
+
+# Any one of these top-level keys marks a dict as conversation-shaped:
+# conversation containers plus plain text fields.
+CONVERSATION_FIELDS = frozenset(
+    ("messages", "content", "conversation", "chat", "dialogue", "text", "message", "response")
+)
+
+# Words hinting at a Claude Desktop / MCP export, matched case-insensitively
+# against the whole serialized document (see lowered_json).
+_CLAUDE_DESKTOP_INDICATORS = (b"claude", b"desktop", b"mcp", b"anthropic")
+
 
 class PlatformType(Enum):
     """Supported AI platform types."""
@@ -34,8 +82,10 @@ class PlatformType(Enum):
 class FormatDetector:
     """Detects and validates AI conversation export formats."""
 
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    # Stateless: no per-instance dict. The module logger stays reachable as
+    # an attribute for existing callers.
+    __slots__ = ()
+    logger = logger
 
     def detect_format(self, file_path: Path) -> dict[str, Any]:
         """
@@ -66,7 +116,7 @@ class FormatDetector:
                 )
 
         except Exception as e:  # noqa: BLE001 - best-effort platform classification: report UNKNOWN/0.0 rather than crash on arbitrary file content
-            self.logger.exception(f"Error detecting format for {file_path}: {e}")
+            logger.exception(f"Error detecting format for {file_path}: {e}")
             return self._create_result(PlatformType.UNKNOWN, 0.0, f"Detection error: {str(e)}")
 
     def _detect_json_format(self, file_path: Path) -> dict[str, Any]:
@@ -114,7 +164,7 @@ class FormatDetector:
         """Detect format for text/markdown files."""
         try:
             with open(file_path, encoding="utf-8") as f:
-                content = f.read()
+                content = f.read(_TEXT_DETECTION_PREFIX_CHARS)
 
             # Check for Claude web interface format
             if self._is_claude_web_format(content):
@@ -173,8 +223,7 @@ class FormatDetector:
             return False
 
         # Cursor format indicators
-        cursor_indicators = ["session_id", "workspace", "interactions", "model"]
-        has_indicators = sum(1 for key in cursor_indicators if key in data)
+        has_indicators = len(data.keys() & _CURSOR_INDICATORS)
 
         # Also check for workspace path patterns
         if "workspace" in data:
@@ -190,8 +239,7 @@ class FormatDetector:
             return False
 
         # Our format has specific structure
-        required_fields = ["id", "title", "content", "date", "topics", "created_at"]
-        has_required = sum(1 for field in required_fields if field in data)
+        has_required = len(data.keys() & CLAUDE_MEMORY_FIELDS)
 
         # Check for our specific ID format
         if (
@@ -210,10 +258,11 @@ class FormatDetector:
             return False
 
         # Claude Desktop might have MCP-specific fields
-        claude_indicators = ["claude", "desktop", "mcp", "anthropic"]
-        content_str = json.dumps(data).lower()
+        content_bytes = lowered_json(data)
 
-        indicator_count = sum(1 for indicator in claude_indicators if indicator in content_str)
+        indicator_count = sum(
+            1 for indicator in _CLAUDE_DESKTOP_INDICATORS if indicator in content_bytes
+        )
 
         # Also check for conversation structure
         if self._has_conversation_structure(data):
@@ -224,34 +273,18 @@ class FormatDetector:
     def _is_claude_web_format(self, content: str) -> bool:
         """Check if text matches Claude web interface format."""
         # Look for Claude web conversation patterns
-        claude_patterns = [
-            r"\*\*Human\*\*:",
-            r"\*\*Claude\*\*:",
-            r"# Conversation with Claude",
-            r"Human:.*\n.*Claude:",
-        ]
-
-        pattern_matches = sum(
-            1
-            for pattern in claude_patterns
-            if re.search(pattern, content, re.IGNORECASE | re.MULTILINE)
-        )
-
-        return pattern_matches >= 1
+        return any(pattern.search(content) for pattern in _CLAUDE_WEB_PATTERNS)
 
     def _is_markdown_conversation(self, content: str) -> bool:
         """Check if text is a markdown-formatted conversation."""
-        # Look for conversation indicators
-        conversation_patterns = [
-            r"\*\*.*\*\*:",  # Bold role indicators
-            r"^[A-Z][a-z]+:",  # Simple role indicators
-            r"^\s*>\s*",  # Quote blocks
-            r"#{1,3}\s*",  # Headers
-        ]
-
-        pattern_matches = sum(
-            1 for pattern in conversation_patterns if re.search(pattern, content, re.MULTILINE)
-        )
+        # Look for conversation indicators; two are enough, so stop there
+        # instead of scanning the content with the remaining patterns
+        pattern_matches = 0
+        for pattern in _MARKDOWN_CONVERSATION_PATTERNS:
+            if pattern.search(content):
+                pattern_matches += 1
+                if pattern_matches >= 2:
+                    return True
 
         # Also check for back-and-forth conversation flow
         lines = content.split("\n")
@@ -263,9 +296,11 @@ class FormatDetector:
                 potential_role = line.split(":")[0].strip("*# ")
                 if potential_role != current_role and len(potential_role) < 20:
                     role_changes += 1
+                    if role_changes >= 3:
+                        return True
                     current_role = potential_role
 
-        return pattern_matches >= 2 or role_changes >= 3
+        return False
 
     def _has_role_based_messages(self, messages: list[Any]) -> bool:
         """Check if messages have role-based structure (user/assistant)."""
@@ -286,20 +321,8 @@ class FormatDetector:
         if not isinstance(data, dict):
             return False
 
-        # Look for common conversation fields
-        conversation_fields = [
-            "messages",
-            "content",
-            "conversation",
-            "chat",
-            "dialogue",
-        ]
-        text_fields = ["text", "content", "message", "response"]
-
-        has_conversation = any(field in data for field in conversation_fields)
-        has_text = any(field in data for field in text_fields)
-
-        return has_conversation or has_text
+        # Look for common conversation or text fields
+        return not data.keys().isdisjoint(CONVERSATION_FIELDS)
 
     def _create_result(
         self, platform: PlatformType, confidence: float, message: str
@@ -309,7 +332,7 @@ class FormatDetector:
             "platform": platform.value,
             "confidence": confidence,
             "message": message,
-            "timestamp": Path(__file__).stat().st_mtime,  # Detection time
+            "timestamp": time.time(),  # Detection time
         }
 
     def get_supported_platforms(self) -> list[str]:
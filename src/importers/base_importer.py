@@ -5,7 +5,10 @@ Base importer class for Universal Memory MCP.
 Defines the interface and common functionality for all platform importers.
 """
 
+import json
 import logging
+import re
+import secrets
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
@@ -13,10 +16,95 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-logger = logging.getLogger(__name__)
+import orjson
+
+from term_matching import build_term_automaton, find_terms
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Common technology and conversation topics, matched as substrings of the
+# lowercased content by BaseImporter._extract_topics.
+_TECH_TOPICS = (
+    "python",
+    "javascript",
+    "java",
+    "css",
+    "html",
+    "react",
+    "vue",
+    "angular",
+    "django",
+    "flask",
+    "nodejs",
+    "express",
+    "api",
+    "database",
+    "sql",
+    "mongodb",
+    "docker",
+    "kubernetes",
+    "aws",
+    "azure",
+    "gcp",
+    "git",
+    "github",
+    "gitlab",
+    "testing",
+    "debugging",
+    "deployment",
+    "authentication",
+    "security",
+    "encryption",
+    "machine learning",
+    "ai",
+    "neural network",
+    "data science",
+    "analytics",
+    "programming",
+    "coding",
+    "development",
+    "software",
+    "web development",
+    "mobile",
+    "ios",
+    "android",
+    "frontend",
+    "backend",
+    "fullstack",
+)
+
+_TECH_TOPICS_AUTOMATON = build_term_automaton(_TECH_TOPICS)
+
+# orjson options for saved conversation files. Same on-disk shape as
+# json.dump(indent=2, ensure_ascii=False): orjson never escapes non-ASCII,
+# and non-string keys are stringified as json.dump does.
+CONVERSATION_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Zero-padded shapes covered by _parse_timestamp's format list (after "Z" is
+# stripped): date only, date and time, and "T"-separated with a fraction.
+_ISO_TIMESTAMP_RE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+    r"(?:T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?| [0-9]{2}:[0-9]{2}:[0-9]{2})?"
+)
+
+
+def load_export_json(file_path: Path) -> Any:
+    """Parse a JSON export file, accepting everything ``json.load`` does.
+
+    orjson parses large exports several times faster, but rejects NaN and
+    Infinity and lone surrogate escapes such as ``"\\ud83d"``, which
+    ``json`` accepts and real exports contain; those files are re-parsed
+    with ``json``. Invalid JSON raises ``json.JSONDecodeError`` either way
+    (orjson's error subclasses it).
+    """
+    raw = file_path.read_bytes()
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw.decode("utf-8"))
+
+
+@dataclass(slots=True)
 class ImportResult:
     """Result of an import operation."""
 
@@ -27,6 +115,18 @@ class ImportResult:
     imported_ids: list[str]
     metadata: dict[str, Any]
 
+    @classmethod
+    def failed(cls, error: str) -> "ImportResult":
+        """Result for an import that failed as a whole with a single error."""
+        return cls(
+            success=False,
+            conversations_imported=0,
+            conversations_failed=1,
+            errors=[error],
+            imported_ids=[],
+            metadata={},
+        )
+
     @property
     def total_processed(self) -> int:
         return self.conversations_imported + self.conversations_failed
@@ -51,7 +151,10 @@ class BaseImporter(ABC):
         """
         self.storage_path = Path(storage_path)
         self.platform_name = platform_name
+        self._default_title = f"{platform_name.title()} Conversation"
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # Month folders this importer has already created, by (year, month)
+        self._month_folders: dict[tuple[int, int], Path] = {}
 
         # Ensure storage directory exists
         self.storage_path.mkdir(parents=True, exist_ok=True)
@@ -95,6 +198,7 @@ class BaseImporter(ABC):
         tags: list[str] | None = None,
         conversation_type: str | None = None,
         custom_fields: dict[str, Any] | None = None,
+        content_lower: str | None = None,
     ) -> dict[str, Any]:
         """
         Create a conversation in universal internal format.
@@ -118,19 +222,22 @@ class BaseImporter(ABC):
                 "code", "analysis", etc. Free-form string.
             custom_fields: Open extensibility bucket for arbitrary
                 platform/user-defined metadata. Defaults to an empty dict.
+            content_lower: ``content.lower()``, if the caller already has it,
+                so topic extraction doesn't lowercase the content again.
 
         Returns:
             Conversation in universal format
         """
         conversation_id = self._generate_conversation_id(date)
-        topics = self._extract_topics(content)
+        topics = self._extract_topics(content, content_lower)
+        now_iso = datetime.now().isoformat()
 
         universal_conv = {
             "id": conversation_id,
             "platform": self.platform_name,
             "platform_id": platform_id,
             "model": model or "unknown",
-            "title": title or f"{self.platform_name.title()} Conversation",
+            "title": title or self._default_title,
             "content": content,
             "messages": messages,
             "date": date.isoformat(),
@@ -148,12 +255,12 @@ class BaseImporter(ABC):
             "conversation_type": conversation_type,
             "custom_fields": dict(custom_fields) if custom_fields else {},
             "import_metadata": {
-                "imported_at": datetime.now().isoformat(),
+                "imported_at": now_iso,
                 "source_format": self.platform_name,
                 "import_version": "1.0",
                 "original_platform_id": platform_id,
             },
-            "created_at": datetime.now().isoformat(),
+            "created_at": now_iso,
         }
 
         # Add any additional metadata
@@ -162,83 +269,49 @@ class BaseImporter(ABC):
 
         return universal_conv
 
+    def _get_month_folder(self, date: datetime) -> Path:
+        """Return the storage folder for ``date``'s month, creating it if needed.
+
+        A bulk import lands most conversations in a handful of months, so
+        each folder is built and mkdir'd once per importer instead of on
+        every save.
+        """
+        key = (date.year, date.month)
+        month_folder = self._month_folders.get(key)
+        if month_folder is None:
+            year_folder = self.storage_path / str(date.year)
+            month_folder = year_folder / f"{date.month:02d}-{date.strftime('%B').lower()}"
+            month_folder.mkdir(parents=True, exist_ok=True)
+            self._month_folders[key] = month_folder
+        return month_folder
+
     def _generate_conversation_id(self, date: datetime) -> str:
         """Generate a unique conversation ID."""
         timestamp = date.strftime("%Y%m%d_%H%M%S")
-        random_suffix = str(uuid.uuid4())[:8]
+        random_suffix = secrets.token_hex(4)
         return f"conv_{timestamp}_{random_suffix}"
 
-    def _extract_topics(self, content: str) -> list[str]:
+    def _extract_topics(self, content: str, content_lower: str | None = None) -> list[str]:
         """
         Extract topics from conversation content.
 
         This is a basic implementation that can be overridden by specific importers
-        for platform-specific topic extraction.
+        for platform-specific topic extraction. ``content_lower`` is
+        ``content.lower()`` when the caller already has it.
         """
         if not content:
             return []
 
-        content_lower = content.lower()
-
-        # Common technology and conversation topics
-        tech_topics = [
-            "python",
-            "javascript",
-            "java",
-            "css",
-            "html",
-            "react",
-            "vue",
-            "angular",
-            "django",
-            "flask",
-            "nodejs",
-            "express",
-            "api",
-            "database",
-            "sql",
-            "mongodb",
-            "docker",
-            "kubernetes",
-            "aws",
-            "azure",
-            "gcp",
-            "git",
-            "github",
-            "gitlab",
-            "testing",
-            "debugging",
-            "deployment",
-            "authentication",
-            "security",
-            "encryption",
-            "machine learning",
-            "ai",
-            "neural network",
-            "data science",
-            "analytics",
-            "programming",
-            "coding",
-            "development",
-            "software",
-            "web development",
-            "mobile",
-            "ios",
-            "android",
-            "frontend",
-            "backend",
-            "fullstack",
-        ]
-
-        found_topics = []
-        for topic in tech_topics:
-            if topic in content_lower:
-                found_topics.append(topic)
+        if content_lower is None:
+            content_lower = content.lower()
+        found_topics = find_terms(content_lower, _TECH_TOPICS, _TECH_TOPICS_AUTOMATON)
 
-        # Add platform-specific topic
-        found_topics.append(self.platform_name)
+        # find_terms yields each term once, so the platform name is the only
+        # possible duplicate
+        if self.platform_name not in found_topics:
+            found_topics.append(self.platform_name)
 
-        return list(set(found_topics))  # Remove duplicates
+        return found_topics
 
     def _create_message(
         self,
@@ -259,6 +332,18 @@ class BaseImporter(ABC):
 
     def _parse_timestamp(self, timestamp_str: str) -> datetime:
         """Parse various timestamp formats to datetime."""
+        naive_str = timestamp_str.replace("Z", "")
+
+        # Fast path: for the zero-padded shapes the formats below accept, one
+        # C-level fromisoformat call replaces a cascade of strptime attempts.
+        # fromisoformat alone is far more lenient (offsets, compact dates,
+        # any separator), hence the shape check first.
+        if _ISO_TIMESTAMP_RE.fullmatch(naive_str):
+            try:
+                return datetime.fromisoformat(naive_str)
+            except ValueError:
+                pass  # e.g. month 13; let the formats below decide
+
         # Common timestamp formats
         formats = [
             "%Y-%m-%dT%H:%M:%S.%fZ",  # ISO with microseconds and Z
@@ -270,7 +355,7 @@ class BaseImporter(ABC):
 
         for fmt in formats:
             try:
-                return datetime.strptime(timestamp_str.replace("Z", ""), fmt.replace("Z", ""))
+                return datetime.strptime(naive_str, fmt.replace("Z", ""))
             except ValueError:
                 continue
 
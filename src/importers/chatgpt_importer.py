@@ -11,12 +11,38 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from term_matching import build_term_automaton, find_terms
 from validators import validate_import_file_path
 
-from .base_importer import BaseImporter, ImportResult
+from .base_importer import (
+    CONVERSATION_JSON_OPTIONS,
+    BaseImporter,
+    ImportResult,
+    load_export_json,
+)
 
 logger = logging.getLogger(__name__)
 
+# Content labels for the common roles, so the per-message loop skips
+# role.title(); other roles are still title-cased.
+_ROLE_DISPLAY = {"user": "**Human**", "assistant": "**Assistant**", "system": "**System**"}
+
+# ChatGPT-specific topic terms, matched on top of the base vocabulary
+_CHATGPT_TOPICS = (
+    "openai",
+    "gpt",
+    "artificial intelligence",
+    "language model",
+    "prompt",
+    "chatbot",
+    "ai assistant",
+    "machine learning",
+)
+
+_CHATGPT_TOPICS_AUTOMATON = build_term_automaton(_CHATGPT_TOPICS)
+
 
 class ChatGPTImporter(BaseImporter):
     """Importer for ChatGPT conversation exports."""
@@ -37,53 +63,24 @@ class ChatGPTImporter(BaseImporter):
         """
         try:
             if not file_path.exists():
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=[f"File not found: {file_path}"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed(f"File not found: {file_path}")
 
             file_path = validate_import_file_path(file_path)
 
             # Load and validate ChatGPT export file
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_export_json(file_path)
 
             if not self._validate_chatgpt_format(data):
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=["File is not a valid ChatGPT export format"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed("File is not a valid ChatGPT export format")
 
             # Process each conversation
             conversations = data.get("conversations", [])
             return self._process_conversations(conversations, file_path)
 
         except json.JSONDecodeError as e:
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Invalid JSON format: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Invalid JSON format: {str(e)}")
         except Exception as e:  # noqa: BLE001 - top-level import boundary: report failure via ImportResult instead of crashing the batch run
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Import failed: {str(e)}")
 
     def _process_conversations(self, conversations: list[Any], file_path: Path) -> ImportResult:
         """Process list of conversations and return import result."""
@@ -163,6 +160,11 @@ class ChatGPTImporter(BaseImporter):
 
         date = self._parse_timestamp(create_time_str) if create_time_str else datetime.now()
 
+        # Message timestamps repeat within a conversation (the first one
+        # usually equals create_time), so each distinct string is parsed
+        # once.
+        parsed_times = {create_time_str: date}
+
         # Process messages
         raw_messages = raw_data.get("messages", [])
         messages = []
@@ -180,8 +182,14 @@ class ChatGPTImporter(BaseImporter):
             if not content or not content.strip():
                 continue
 
-            # Create standardized message
-            timestamp = self._parse_timestamp(msg_time_str) if msg_time_str else date
+            # Create standardized message; a missing or null timestamp
+            # falls back to the conversation date
+            if not msg_time_str:
+                timestamp = date
+            else:
+                timestamp = parsed_times.get(msg_time_str)
+                if timestamp is None:
+                    timestamp = parsed_times[msg_time_str] = self._parse_timestamp(msg_time_str)
 
             message = self._create_message(
                 role=role,
@@ -193,7 +201,7 @@ class ChatGPTImporter(BaseImporter):
             messages.append(message)
 
             # Add to content string for full conversation text
-            role_display = "**Human**" if role == "user" else f"**{role.title()}**"
+            role_display = _ROLE_DISPLAY.get(role) or f"**{role.title()}**"
             content_parts.append(f"{role_display}: {content}")
 
         # Combine all messages into content string
@@ -366,42 +374,32 @@ class ChatGPTImporter(BaseImporter):
         """Save a conversation to the storage directory."""
         # Create date-based subdirectory
         date = datetime.fromisoformat(conversation["date"].replace("Z", "+00:00"))
-        year_folder = self.storage_path / str(date.year)
-        month_folder = year_folder / f"{date.month:02d}-{date.strftime('%B').lower()}"
-        month_folder.mkdir(parents=True, exist_ok=True)
+        month_folder = self._get_month_folder(date)
 
         # Save conversation file
         filename = f"{conversation['id']}.json"
         file_path = month_folder / filename
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(conversation, f, indent=2, ensure_ascii=False)
+        file_path.write_bytes(orjson.dumps(conversation, option=CONVERSATION_JSON_OPTIONS))
 
         self.logger.info(f"Saved conversation to: {file_path}")
         return file_path
 
-    def _extract_topics(self, content: str) -> list[str]:
+    def _extract_topics(self, content: str, content_lower: str | None = None) -> list[str]:
         """Override base topic extraction for ChatGPT-specific patterns."""
-        topics = super()._extract_topics(content)
+        if content_lower is None:
+            content_lower = content.lower()
+        topics = super()._extract_topics(content, content_lower)
 
         # Add ChatGPT-specific topic indicators
-        content_lower = content.lower()
-
-        # ChatGPT-specific terms
-        chatgpt_topics = [
-            "openai",
-            "gpt",
-            "artificial intelligence",
-            "language model",
-            "prompt",
-            "chatbot",
-            "ai assistant",
-            "machine learning",
-        ]
-
-        for topic in chatgpt_topics:
-            if topic in content_lower and topic not in topics:
-                topics.append(topic)
+        # find_terms yields each term once, so only overlap with the base
+        # topics needs filtering
+        seen = set(topics)
+        topics.extend(
+            topic
+            for topic in find_terms(content_lower, _CHATGPT_TOPICS, _CHATGPT_TOPICS_AUTOMATON)
+            if topic not in seen
+        )
 
         # Always include platform identifier
         if "chatgpt" not in topics:
@@ -13,12 +13,62 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
+from format_detector import CLAUDE_MEMORY_FIELDS, CONVERSATION_FIELDS
+from term_matching import build_term_automaton, find_terms, lowered_json
 from validators import validate_import_file_path
 
-from .base_importer import BaseImporter, ImportResult
+from .base_importer import (
+    CONVERSATION_JSON_OPTIONS,
+    BaseImporter,
+    ImportResult,
+    load_export_json,
+)
 
 logger = logging.getLogger(__name__)
 
+# Common Claude markdown speaker markers: "**Human**:" or plain "Human:".
+_SPEAKER_WORDS = ("human", "claude")
+_SPEAKER_MARKER_RE = re.compile(
+    r"\*\*(?P<bold>human|claude)\*\*:|(?P<plain>human|claude):", re.IGNORECASE
+)
+
+# Claude-specific topic terms, matched after the base tech vocabulary.
+_CLAUDE_TOPICS = (
+    "claude",
+    "anthropic",
+    "ai assistant",
+    "conversation",
+    "natural language",
+    "reasoning",
+    "analysis",
+    "creative writing",
+)
+
+_CLAUDE_TOPICS_AUTOMATON = build_term_automaton(_CLAUDE_TOPICS)
+
+
+def _find_speaker_markers(lowered: str) -> list[tuple[int, int, str]]:
+    """Locate speaker markers in lowercased text as sorted (start, end, speaker).
+
+    Finds the same markers as _SPEAKER_MARKER_RE, but str.find jumps between
+    occurrences of the speaker words instead of the regex engine stepping
+    through every character.
+    """
+    markers = []
+    for word in _SPEAKER_WORDS:
+        pos = lowered.find(word)
+        while pos != -1:
+            after = pos + len(word)
+            if pos >= 2 and lowered.startswith("**", pos - 2) and lowered.startswith("**:", after):
+                markers.append((pos - 2, after + 3, word))
+            elif lowered.startswith(":", after):
+                markers.append((pos, after + 1, word))
+            pos = lowered.find(word, after)
+    markers.sort()
+    return markers
+
 
 class ClaudeImporter(BaseImporter):
     """Importer for Claude conversation exports in various formats."""
@@ -42,14 +92,7 @@ class ClaudeImporter(BaseImporter):
         """
         try:
             if not file_path.exists():
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=[f"File not found: {file_path}"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed(f"File not found: {file_path}")
 
             file_path = validate_import_file_path(file_path)
 
@@ -61,49 +104,30 @@ class ClaudeImporter(BaseImporter):
             elif extension in [".md", ".txt"]:
                 return self._import_text_format(file_path)
             else:
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=[f"Unsupported file format: {extension}"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed(f"Unsupported file format: {extension}")
 
         except Exception as e:  # noqa: BLE001 - top-level import boundary: report failure via ImportResult instead of crashing the batch run
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Import failed: {str(e)}")
 
     def _import_json_format(self, file_path: Path) -> ImportResult:
         """Import JSON format Claude files."""
         try:
-            with open(file_path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_export_json(file_path)
 
             # Detect specific Claude JSON format
             if self._is_claude_memory_format(data):
                 return self._import_claude_memory_format(file_path, data)
-            elif self._is_claude_desktop_format(data):
-                return self._import_claude_desktop_format(file_path, data)
+
+            # Serialized once for both desktop detection and variant detection
+            content_bytes = lowered_json(data)
+            if self._is_claude_desktop_format(data, content_bytes):
+                return self._import_claude_desktop_format(file_path, data, content_bytes)
             else:
                 # Try to parse as generic Claude conversation
-                return self._import_generic_claude_json(file_path, data)
+                return self._import_generic_claude_json(file_path, data, content_bytes)
 
         except json.JSONDecodeError as e:
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Invalid JSON format: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Invalid JSON format: {str(e)}")
 
     def _import_text_format(self, file_path: Path) -> ImportResult:
         """Import text/markdown format Claude files."""
@@ -130,24 +154,10 @@ class ClaudeImporter(BaseImporter):
                     },
                 )
             else:
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=["Failed to parse markdown conversation"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed("Failed to parse markdown conversation")
 
         except Exception as e:  # noqa: BLE001 - best-effort text parse: report failure via ImportResult instead of crashing
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Text import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Text import failed: {str(e)}")
 
     def _import_claude_memory_format(self, file_path: Path, data: dict[str, Any]) -> ImportResult:
         """Import existing Claude Memory format - already in universal format."""
@@ -169,29 +179,17 @@ class ClaudeImporter(BaseImporter):
                     },
                 )
             else:
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=["Invalid Claude Memory format"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed("Invalid Claude Memory format")
 
         except Exception as e:  # noqa: BLE001 - top-level format-branch boundary: report failure via ImportResult instead of crashing
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Claude Memory import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Claude Memory import failed: {str(e)}")
 
-    def _import_claude_desktop_format(self, file_path: Path, data: dict[str, Any]) -> ImportResult:
+    def _import_claude_desktop_format(
+        self, file_path: Path, data: dict[str, Any], content_bytes: bytes | None = None
+    ) -> ImportResult:
         """Import Claude Desktop MCP format."""
         try:
-            universal_conv = self.parse_conversation(data)
+            universal_conv = self._parse_sniffed_json(data, content_bytes)
 
             if self._validate_conversation(universal_conv):
                 self._save_conversation(universal_conv)
@@ -209,29 +207,17 @@ class ClaudeImporter(BaseImporter):
                     },
                 )
             else:
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=["Invalid conversation format after parsing"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed("Invalid conversation format after parsing")
 
         except Exception as e:  # noqa: BLE001 - top-level format-branch boundary: report failure via ImportResult instead of crashing
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Claude Desktop import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Claude Desktop import failed: {str(e)}")
 
-    def _import_generic_claude_json(self, file_path: Path, data: dict[str, Any]) -> ImportResult:
+    def _import_generic_claude_json(
+        self, file_path: Path, data: dict[str, Any], content_bytes: bytes | None = None
+    ) -> ImportResult:
         """Import generic Claude JSON format."""
         try:
-            universal_conv = self.parse_conversation(data)
+            universal_conv = self._parse_sniffed_json(data, content_bytes)
 
             if self._validate_conversation(universal_conv):
                 self._save_conversation(universal_conv)
@@ -249,24 +235,10 @@ class ClaudeImporter(BaseImporter):
                     },
                 )
             else:
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=["Invalid conversation format after parsing"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed("Invalid conversation format after parsing")
 
         except Exception as e:  # noqa: BLE001 - top-level format-branch boundary: report failure via ImportResult instead of crashing
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Generic Claude import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Generic Claude import failed: {str(e)}")
 
     def parse_conversation(self, raw_data: Any) -> dict[str, Any]:
         """
@@ -282,11 +254,27 @@ class ClaudeImporter(BaseImporter):
             if self._is_claude_memory_format(raw_data):
                 return raw_data  # Already in universal format
             else:
-                return self._parse_claude_json(raw_data)
+                return self._parse_claude_json(raw_data, is_memory=False)
         else:
             raise TypeError("Claude conversation data must be string or dictionary")
 
-    def _parse_claude_json(self, data: dict[str, Any]) -> dict[str, Any]:
+    def _parse_sniffed_json(self, data: Any, content_bytes: bytes | None) -> dict[str, Any]:
+        """Parse JSON already ruled out as Claude Memory format.
+
+        Dicts skip parse_conversation's repeated format check and reuse the
+        ``content_bytes`` already computed for desktop detection; anything
+        else gets parse_conversation's usual TypeError.
+        """
+        if isinstance(data, dict):
+            return self._parse_claude_json(data, content_bytes, is_memory=False)
+        return self.parse_conversation(data)
+
+    def _parse_claude_json(
+        self,
+        data: dict[str, Any],
+        content_bytes: bytes | None = None,
+        is_memory: bool | None = None,
+    ) -> dict[str, Any]:
         """Parse Claude JSON conversation data."""
         # Extract basic information
         platform_id = data.get("id", "")
@@ -313,7 +301,7 @@ class ClaudeImporter(BaseImporter):
 
         # Create session context
         session_context = {
-            "claude_variant": self._detect_claude_variant(data),
+            "claude_variant": self._detect_claude_variant(data, content_bytes, is_memory),
             "original_format": "claude_json",
         }
 
@@ -388,8 +376,11 @@ class ClaudeImporter(BaseImporter):
         elif file_path:
             title = file_path.stem.replace("_", " ").title()
 
+        # Lowercase once for both speaker markers and topic extraction
+        content_lower = content.lower()
+
         # Extract messages using pattern matching
-        messages = self._extract_messages_from_markdown(content)
+        messages = self._extract_messages_from_markdown(content, content_lower)
 
         # Generate conversation ID and date
         date = datetime.now()
@@ -411,45 +402,43 @@ class ClaudeImporter(BaseImporter):
             model="claude-3.5-sonnet",
             session_context=session_context,
             metadata={"source_type": "markdown", "line_count": len(lines)},
+            content_lower=content_lower,
         )
 
-    def _extract_messages_from_markdown(self, content: str) -> list[dict[str, Any]]:
+    def _extract_messages_from_markdown(
+        self, content: str, content_lower: str | None = None
+    ) -> list[dict[str, Any]]:
         """Extract individual messages from markdown conversation."""
+        lowered = content.lower() if content_lower is None else content_lower
+        if len(lowered) == len(content):
+            markers = _find_speaker_markers(lowered)
+        else:
+            # A few characters lowercase to more than one, which would shift
+            # offsets in the lowered copy; scan the original text instead.
+            markers = [
+                (m.start(), m.end(), (m.group("bold") or m.group("plain")).lower())
+                for m in _SPEAKER_MARKER_RE.finditer(content)
+            ]
+
         messages = []
 
-        # Common Claude markdown patterns
-        patterns = [
-            r"\*\*Human\*\*:\s*(.*?)(?=\*\*Claude\*\*:|\*\*Human\*\*:|$)",
-            r"\*\*Claude\*\*:\s*(.*?)(?=\*\*Human\*\*:|\*\*Claude\*\*:|$)",
-            r"Human:\s*(.*?)(?=Claude:|Human:|$)",
-            r"Claude:\s*(.*?)(?=Human:|Claude:|$)",
-        ]
-
-        for pattern in patterns:
-            matches = re.finditer(pattern, content, re.DOTALL | re.IGNORECASE)
-            for match in matches:
-                role_text = match.group(0)
-                message_content = match.group(1).strip()
-
-                if not message_content:
-                    continue
-
-                # Determine role
-                if "human" in role_text.lower():
-                    role = "user"
-                elif "claude" in role_text.lower():
-                    role = "assistant"
-                else:
-                    role = "unknown"
-
-                message = self._create_message(
-                    role=role,
-                    content=message_content,
-                    metadata={"source": "markdown_extraction"},
-                )
-                messages.append(message)
+        # Each message runs from its speaker marker to the next marker (or the
+        # end of the text), so the markers split the whole conversation in
+        # text order.
+        for index, (_, marker_end, speaker) in enumerate(markers):
+            end = markers[index + 1][0] if index + 1 < len(markers) else len(content)
+            message_content = content[marker_end:end].strip()
+
+            if not message_content:
+                continue
+
+            message = self._create_message(
+                role="user" if speaker == "human" else "assistant",
+                content=message_content,
+                metadata={"source": "markdown_extraction"},
+            )
+            messages.append(message)
 
-        # Sort messages by their position in the text
         return messages
 
     def _extract_messages_from_content(self, content: str) -> list[dict[str, Any]]:
@@ -459,8 +448,10 @@ class ClaudeImporter(BaseImporter):
 
     def _is_claude_memory_format(self, data: dict[str, Any]) -> bool:
         """Check if data is in Claude Memory format."""
-        required_fields = ["id", "title", "content", "date", "topics", "created_at"]
-        has_required = sum(1 for field in required_fields if field in data)
+        if not isinstance(data, dict):
+            return False
+
+        has_required = len(data.keys() & CLAUDE_MEMORY_FIELDS)
 
         # Check for our specific ID format
         if (
@@ -473,13 +464,16 @@ class ClaudeImporter(BaseImporter):
 
         return has_required >= 5
 
-    def _is_claude_desktop_format(self, data: dict[str, Any]) -> bool:
+    def _is_claude_desktop_format(
+        self, data: dict[str, Any], content_bytes: bytes | None = None
+    ) -> bool:
         """Check if data is in Claude Desktop MCP format."""
         # Look for MCP-specific indicators
-        content_str = json.dumps(data).lower()
-        mcp_indicators = ["mcp", "desktop", "anthropic"]
+        if content_bytes is None:
+            content_bytes = lowered_json(data)
+        mcp_indicators = [b"mcp", b"desktop", b"anthropic"]
 
-        indicator_count = sum(1 for indicator in mcp_indicators if indicator in content_str)
+        indicator_count = sum(1 for indicator in mcp_indicators if indicator in content_bytes)
 
         # Also check for conversation structure
         if self._has_conversation_structure(data):
@@ -489,29 +483,30 @@ class ClaudeImporter(BaseImporter):
 
     def _has_conversation_structure(self, data: dict[str, Any]) -> bool:
         """Check if data has general conversation structure."""
-        conversation_fields = [
-            "messages",
-            "content",
-            "conversation",
-            "chat",
-            "dialogue",
-        ]
-        text_fields = ["text", "content", "message", "response"]
+        if not isinstance(data, dict):
+            return False
 
-        has_conversation = any(field in data for field in conversation_fields)
-        has_text = any(field in data for field in text_fields)
+        return not data.keys().isdisjoint(CONVERSATION_FIELDS)
 
-        return has_conversation or has_text
+    def _detect_claude_variant(
+        self,
+        data: dict[str, Any],
+        content_bytes: bytes | None = None,
+        is_memory: bool | None = None,
+    ) -> str:
+        """Detect which Claude variant this conversation came from.
 
-    def _detect_claude_variant(self, data: dict[str, Any]) -> str:
-        """Detect which Claude variant this conversation came from."""
-        content_str = json.dumps(data).lower()
+        ``content_bytes`` is ``lowered_json(data)`` and ``is_memory`` is
+        ``self._is_claude_memory_format(data)``, if the caller already has them.
+        """
+        if content_bytes is None:
+            content_bytes = lowered_json(data)
 
-        if "desktop" in content_str or "mcp" in content_str:
+        if b"desktop" in content_bytes or b"mcp" in content_bytes:
             return "claude_desktop"
-        elif "web" in content_str or "browser" in content_str:
+        elif b"web" in content_bytes or b"browser" in content_bytes:
             return "claude_web"
-        elif self._is_claude_memory_format(data):
+        elif self._is_claude_memory_format(data) if is_memory is None else is_memory:
             return "claude_memory"
         else:
             return "claude_generic"
@@ -520,42 +515,32 @@ class ClaudeImporter(BaseImporter):
         """Save a conversation to the storage directory."""
         # Create date-based subdirectory
         date = datetime.fromisoformat(conversation["date"].replace("Z", "+00:00"))
-        year_folder = self.storage_path / str(date.year)
-        month_folder = year_folder / f"{date.month:02d}-{date.strftime('%B').lower()}"
-        month_folder.mkdir(parents=True, exist_ok=True)
+        month_folder = self._get_month_folder(date)
 
         # Save conversation file
         filename = f"{conversation['id']}.json"
         file_path = month_folder / filename
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(conversation, f, indent=2, ensure_ascii=False)
+        file_path.write_bytes(orjson.dumps(conversation, option=CONVERSATION_JSON_OPTIONS))
 
         self.logger.info("Saved Claude conversation to: %s", file_path)
         return file_path
 
-    def _extract_topics(self, content: str) -> list[str]:
+    def _extract_topics(self, content: str, content_lower: str | None = None) -> list[str]:
         """Override base topic extraction for Claude-specific patterns."""
-        topics = super()._extract_topics(content)
+        if content_lower is None:
+            content_lower = content.lower()
+        topics = super()._extract_topics(content, content_lower)
 
         # Add Claude-specific topic indicators
-        content_lower = content.lower()
-
-        # Claude-specific terms
-        claude_topics = [
-            "claude",
-            "anthropic",
-            "ai assistant",
-            "conversation",
-            "natural language",
-            "reasoning",
-            "analysis",
-            "creative writing",
-        ]
-
-        for topic in claude_topics:
-            if topic in content_lower and topic not in topics:
-                topics.append(topic)
+        # find_terms yields each term once, so only overlap with the base
+        # topics needs filtering
+        seen = set(topics)
+        topics.extend(
+            topic
+            for topic in find_terms(content_lower, _CLAUDE_TOPICS, _CLAUDE_TOPICS_AUTOMATON)
+            if topic not in seen
+        )
 
         # Always include platform identifier
         if "claude" not in topics:
@@ -37,14 +37,7 @@ class CursorImporter(BaseImporter):
         """
         try:
             if not file_path.exists():
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=[f"File not found: {file_path}"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed(f"File not found: {file_path}")
 
             file_path = validate_import_file_path(file_path)
 
@@ -53,14 +46,7 @@ class CursorImporter(BaseImporter):
                 data = json.load(f)
 
             if not self._validate_cursor_format(data):
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=["File is not a valid Cursor AI export format"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed("File is not a valid Cursor AI export format")
 
             # Process the session as a single conversation
             try:
@@ -86,45 +72,17 @@ class CursorImporter(BaseImporter):
                         },
                     )
                 else:
-                    return ImportResult(
-                        success=False,
-                        conversations_imported=0,
-                        conversations_failed=1,
-                        errors=["Invalid conversation format after parsing"],
-                        imported_ids=[],
-                        metadata={},
-                    )
+                    return ImportResult.failed("Invalid conversation format after parsing")
 
             except Exception as e:  # noqa: BLE001 - per-session boundary: report failure via ImportResult instead of crashing the batch run
                 error_msg = f"Failed to process Cursor session: {str(e)}"
                 self.logger.exception(error_msg)
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=[error_msg],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed(error_msg)
 
         except json.JSONDecodeError as e:
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Invalid JSON format: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Invalid JSON format: {str(e)}")
         except Exception as e:  # noqa: BLE001 - top-level import boundary: report failure via ImportResult instead of crashing the batch run
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Import failed: {str(e)}")
 
     def parse_conversation(self, raw_data: Any) -> dict[str, Any]:
         """
@@ -419,9 +377,7 @@ class CursorImporter(BaseImporter):
         """Save a conversation to the storage directory."""
         # Create date-based subdirectory
         date = datetime.fromisoformat(conversation["date"].replace("Z", "+00:00"))
-        year_folder = self.storage_path / str(date.year)
-        month_folder = year_folder / f"{date.month:02d}-{date.strftime('%B').lower()}"
-        month_folder.mkdir(parents=True, exist_ok=True)
+        month_folder = self._get_month_folder(date)
 
         # Save conversation file
         filename = f"{conversation['id']}.json"
@@ -433,12 +389,13 @@ class CursorImporter(BaseImporter):
         self.logger.info("Saved Cursor session to: %s", file_path)
         return file_path
 
-    def _extract_topics(self, content: str) -> list[str]:
+    def _extract_topics(self, content: str, content_lower: str | None = None) -> list[str]:
         """Override base topic extraction for Cursor-specific patterns."""
-        topics = super()._extract_topics(content)
+        if content_lower is None:
+            content_lower = content.lower()
+        topics = super()._extract_topics(content, content_lower)
 
         # Add Cursor-specific topic indicators
-        content_lower = content.lower()
 
         # Cursor-specific terms
         cursor_topics = [
@@ -453,9 +410,11 @@ class CursorImporter(BaseImporter):
             "pair programming",
         ]
 
+        seen = set(topics)
         for topic in cursor_topics:
-            if topic in content_lower and topic not in topics:
+            if topic in content_lower and topic not in seen:
                 topics.append(topic)
+                seen.add(topic)
 
         # Extract programming language topics from file extensions
         file_extensions = {
@@ -477,8 +436,9 @@ class CursorImporter(BaseImporter):
         }
 
         for ext, lang in file_extensions.items():
-            if ext in content_lower and lang not in topics:
+            if ext in content_lower and lang not in seen:
                 topics.append(lang)
+                seen.add(lang)
 
         # Always include platform identifier
         if "cursor" not in topics:
@@ -41,14 +41,7 @@ class GenericImporter(BaseImporter):
         """
         try:
             if not file_path.exists():
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=[f"File not found: {file_path}"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed(f"File not found: {file_path}")
 
             file_path = validate_import_file_path(file_path)
 
@@ -68,14 +61,7 @@ class GenericImporter(BaseImporter):
                 return self._import_text_format(file_path)
 
         except Exception as e:  # noqa: BLE001 - top-level import boundary: report failure via ImportResult instead of crashing the batch run
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Import failed: {str(e)}")
 
     def _import_json_format(self, file_path: Path) -> ImportResult:
         """Import generic JSON format files."""
@@ -94,27 +80,13 @@ class GenericImporter(BaseImporter):
                 conversations = self._parse_json_object(data)
             else:
                 # Unexpected format
-                return ImportResult(
-                    success=False,
-                    conversations_imported=0,
-                    conversations_failed=1,
-                    errors=["Unsupported JSON structure"],
-                    imported_ids=[],
-                    metadata={},
-                )
+                return ImportResult.failed("Unsupported JSON structure")
 
             # Process and save conversations
             return self._save_conversations(conversations, file_path, "generic_json")
 
         except json.JSONDecodeError as e:
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Invalid JSON format: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Invalid JSON format: {str(e)}")
 
     def _import_text_format(self, file_path: Path) -> ImportResult:
         """Import text/markdown format files."""
@@ -128,14 +100,7 @@ class GenericImporter(BaseImporter):
             return self._save_conversations(conversations, file_path, "generic_text")
 
         except Exception as e:  # noqa: BLE001 - best-effort text parse: report failure via ImportResult instead of crashing
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"Text import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"Text import failed: {str(e)}")
 
     def _import_csv_format(self, file_path: Path) -> ImportResult:
         """Import CSV format files."""
@@ -188,14 +153,7 @@ class GenericImporter(BaseImporter):
             return self._save_conversations(conversations, file_path, "generic_csv")
 
         except Exception as e:  # noqa: BLE001 - best-effort CSV parse: report failure via ImportResult instead of crashing
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"CSV import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"CSV import failed: {str(e)}")
 
     def _import_xml_format(self, file_path: Path) -> ImportResult:
         """Import XML format files."""
@@ -210,14 +168,7 @@ class GenericImporter(BaseImporter):
             return self._save_conversations(conversations, file_path, "generic_xml")
 
         except Exception as e:  # noqa: BLE001 - best-effort XML parse: report failure via ImportResult instead of crashing
-            return ImportResult(
-                success=False,
-                conversations_imported=0,
-                conversations_failed=1,
-                errors=[f"XML import failed: {str(e)}"],
-                imported_ids=[],
-                metadata={},
-            )
+            return ImportResult.failed(f"XML import failed: {str(e)}")
 
     def parse_conversation(self, raw_data: Any) -> dict[str, Any]:
         """
@@ -855,9 +806,7 @@ class GenericImporter(BaseImporter):
         """Save a conversation to the storage directory."""
         # Create date-based subdirectory
         date = datetime.fromisoformat(conversation["date"].replace("Z", "+00:00"))
-        year_folder = self.storage_path / str(date.year)
-        month_folder = year_folder / f"{date.month:02d}-{date.strftime('%B').lower()}"
-        month_folder.mkdir(parents=True, exist_ok=True)
+        month_folder = self._get_month_folder(date)
 
         # Save conversation file
         filename = f"{conversation['id']}.json"
@@ -14,7 +14,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from search_database import SearchDatabase
+from search_database import ADD_CONVERSATIONS_BATCH_SIZE, SearchDatabase
 
 # Constants
 INDEX_JSON_FILENAME = "index.json"
@@ -75,7 +75,7 @@ class ConversationMigrator:
                 self.logger.warning(f"Index file not found: {self.index_file}")
                 return self._migrate_without_index()
 
-            with open(self.index_file) as f:
+            with open(self.index_file, encoding="utf-8") as f:
                 index_data = json.load(f)
 
             conversations = index_data.get("conversations", [])
@@ -83,11 +83,16 @@ class ConversationMigrator:
 
             self.logger.info(f"Found {len(conversations)} conversations in index")
 
+            batch: list[tuple[dict[str, Any], str]] = []
             for conv_info in conversations:
-                if self._migrate_single_conversation(conv_info):
-                    stats["successfully_migrated"] += 1
-                else:
+                item = self._load_indexed_conversation(conv_info)
+                if item is None:
                     stats["failed_migrations"] += 1
+                    continue
+                batch.append(item)
+                if len(batch) >= ADD_CONVERSATIONS_BATCH_SIZE:
+                    self._migrate_batch(batch, stats)
+            self._migrate_batch(batch, stats)
 
             # Rebuild FTS index for optimal performance
             self.search_db.rebuild_fts_index()
@@ -122,11 +127,16 @@ class ConversationMigrator:
         stats["total_found"] = len(conversation_files)
         self.logger.info(f"Found {len(conversation_files)} conversation files")
 
+        batch: list[tuple[dict[str, Any], str]] = []
         for file_path in conversation_files:
-            if self._migrate_json_file(file_path):
-                stats["successfully_migrated"] += 1
-            else:
+            item = self._load_conversation_file(file_path)
+            if item is None:
                 stats["failed_migrations"] += 1
+                continue
+            batch.append(item)
+            if len(batch) >= ADD_CONVERSATIONS_BATCH_SIZE:
+                self._migrate_batch(batch, stats)
+        self._migrate_batch(batch, stats)
 
         # Rebuild FTS index
         self.search_db.rebuild_fts_index()
@@ -134,39 +144,45 @@ class ConversationMigrator:
         self.logger.info(f"Directory scan migration completed: {stats}")
         return stats
 
-    def _migrate_single_conversation(self, conv_info: dict) -> bool:
-        """Migrate a single conversation from index entry."""
+    def _migrate_batch(self, batch: list[tuple[dict[str, Any], str]], stats: dict) -> None:
+        """Write ``batch`` to SQLite in one transaction, count results and clear it."""
+        if not batch:
+            return
+
+        results = self.search_db.add_conversations(batch)
+        for (conv_data, relative_path), success in zip(batch, results, strict=True):
+            if success:
+                stats["successfully_migrated"] += 1
+                self.logger.debug(f"Migrated conversation: {conv_data.get('id', relative_path)}")
+            else:
+                stats["failed_migrations"] += 1
+                self.logger.error(
+                    f"Failed to migrate conversation: {conv_data.get('id', relative_path)}"
+                )
+        batch.clear()
+
+    def _load_indexed_conversation(self, conv_info: dict) -> tuple[dict[str, Any], str] | None:
+        """Load the conversation behind an index entry, or None if it can't be read."""
         try:
             file_path = self.storage_path / conv_info["file_path"]
 
             if not file_path.exists():
                 self.logger.warning(f"Conversation file not found: {file_path}")
-                return False
+                return None
 
             with open(file_path, encoding="utf-8") as f:
                 conv_data = json.load(f)
 
-            # Add conversation to search database
-            relative_path = str(file_path.relative_to(self.storage_path))
-            success = self.search_db.add_conversation(conv_data, relative_path)
-
-            if success:
-                self.logger.debug(f"Migrated conversation: {conv_data.get('id', 'unknown')}")
-            else:
-                self.logger.error(
-                    f"Failed to migrate conversation: {conv_data.get('id', 'unknown')}"
-                )
-
-            return success
+            return conv_data, str(file_path.relative_to(self.storage_path))
 
         except Exception as e:  # noqa: BLE001 - resilience: skip unmigratable conversation, keep processing the rest of the batch
             self.logger.exception(
                 f"Error migrating conversation {conv_info.get('id', 'unknown')}: {e}"
             )
-            return False
+            return None
 
-    def _migrate_json_file(self, file_path: Path) -> bool:
-        """Migrate a single JSON file."""
+    def _load_conversation_file(self, file_path: Path) -> tuple[dict[str, Any], str] | None:
+        """Load a conversation JSON file found by directory scan, or None to skip it."""
         try:
             with open(file_path, encoding="utf-8") as f:
                 conv_data = json.load(f)
@@ -175,26 +191,17 @@ class ConversationMigrator:
             required_fields = ["id", "title", "content", "date"]
             if not all(field in conv_data for field in required_fields):
                 self.logger.warning(f"Skipping file with missing fields: {file_path}")
-                return False
+                return None
 
             # Ensure created_at field exists
             if "created_at" not in conv_data:
                 conv_data["created_at"] = conv_data["date"]
 
-            # Add conversation to search database
-            relative_path = str(file_path.relative_to(self.storage_path))
-            success = self.search_db.add_conversation(conv_data, relative_path)
-
-            if success:
-                self.logger.debug(f"Migrated file: {file_path}")
-            else:
-                self.logger.error(f"Failed to migrate file: {file_path}")
-
-            return success
+            return conv_data, str(file_path.relative_to(self.storage_path))
 
         except Exception as e:  # noqa: BLE001 - resilience: skip unmigratable file, keep processing the rest of the batch
             self.logger.exception(f"Error migrating file {file_path}: {e}")
-            return False
+            return None
 
     def verify_migration(self) -> dict[str, Any]:
         """Verify migration by comparing counts and testing search."""
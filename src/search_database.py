@@ -12,6 +12,11 @@ import sqlite3
 from pathlib import Path
 from typing import Any, ClassVar
 
+# Conversations to pass per add_conversations call (one transaction) when
+# bulk-loading from the JSON files. Bounds how many loaded conversation
+# bodies are held in memory at once.
+ADD_CONVERSATIONS_BATCH_SIZE = 500
+
 
 class SearchDatabase:
     """SQLite FTS5-based search database for conversations."""
@@ -101,6 +106,16 @@ class SearchDatabase:
                     )
                 """)
 
+                # Conversations the index.json backfill could not add (file
+                # missing, unparseable, or rejected), keyed by a stamp of the
+                # file so they're retried only once it changes.
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS sync_failures (
+                        id TEXT PRIMARY KEY,
+                        file_stamp TEXT NOT NULL
+                    )
+                """)
+
                 # Create indexes for performance
                 conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_conversations_date ON conversations(date)"
@@ -176,76 +191,8 @@ class SearchDatabase:
     def add_conversation(self, conversation_data: dict[str, Any], file_path: str) -> bool:
         """Add a conversation to the search database."""
         try:
-            topics = conversation_data.get("topics", []) or []
-            tags = conversation_data.get("tags", []) or []
-            topics_json = json.dumps(topics)
-
-            # Fold tags into topics_text so the existing FTS5 schema picks
-            # them up without needing a virtual-table rebuild. Precise
-            # tag-only lookups use the conversation_tags table below.
-            topics_text = " ".join(topics + tags)
-
-            custom_fields = conversation_data.get("custom_fields") or {}
-            custom_fields_json = json.dumps(custom_fields) if custom_fields else None
-
             with sqlite3.connect(self.db_path) as conn:
-                # Insert into main table
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO conversations
-                    (id, title, content, date, created_at, file_path,
-                     topics_json, topics_text, session_id, user_id,
-                     conversation_type, custom_fields_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        conversation_data["id"],
-                        conversation_data["title"],
-                        conversation_data["content"],
-                        conversation_data["date"],
-                        conversation_data["created_at"],
-                        file_path,
-                        topics_json,
-                        topics_text,
-                        conversation_data.get("session_id"),
-                        conversation_data.get("user_id"),
-                        conversation_data.get("conversation_type"),
-                        custom_fields_json,
-                    ),
-                )
-
-                # Insert topics
-                conn.execute(
-                    "DELETE FROM conversation_topics WHERE conversation_id = ?",
-                    (conversation_data["id"],),
-                )
-
-                for topic in topics:
-                    conn.execute(
-                        """
-                        INSERT INTO conversation_topics (conversation_id, topic)
-                        VALUES (?, ?)
-                    """,
-                        (conversation_data["id"], topic),
-                    )
-
-                # Insert tags
-                conn.execute(
-                    "DELETE FROM conversation_tags WHERE conversation_id = ?",
-                    (conversation_data["id"],),
-                )
-
-                for tag in tags:
-                    if not tag:
-                        continue
-                    conn.execute(
-                        """
-                        INSERT OR IGNORE INTO conversation_tags (conversation_id, tag)
-                        VALUES (?, ?)
-                    """,
-                        (conversation_data["id"], tag),
-                    )
-
+                self._write_conversation(conn, conversation_data, file_path)
                 conn.commit()
                 return True
 
@@ -253,6 +200,97 @@ class SearchDatabase:
             self.logger.exception("Failed to add conversation: %s", e)
             return False
 
+    def add_conversations(self, items: list[tuple[dict[str, Any], str]]) -> list[bool]:
+        """Add many ``(conversation_data, file_path)`` pairs in one transaction.
+
+        Returns one success flag per item. Each item is written under its own
+        savepoint, so a bad row is rolled back and reported without losing
+        the rest of the batch.
+        """
+        results = []
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("BEGIN")
+                for conversation_data, file_path in items:
+                    conn.execute("SAVEPOINT add_conversation")
+                    try:
+                        self._write_conversation(conn, conversation_data, file_path)
+                    except (sqlite3.Error, KeyError, TypeError, ValueError) as e:
+                        conn.execute("ROLLBACK TO add_conversation")
+                        self.logger.exception("Failed to add conversation: %s", e)
+                        results.append(False)
+                    else:
+                        results.append(True)
+                    conn.execute("RELEASE add_conversation")
+                conn.commit()
+                return results
+
+        except sqlite3.Error as e:
+            self.logger.exception("Failed to add conversations: %s", e)
+            return [False] * len(items)
+
+    def _write_conversation(
+        self, conn: sqlite3.Connection, conversation_data: dict[str, Any], file_path: str
+    ) -> None:
+        """Write one conversation and its topic/tag rows on ``conn`` (no commit)."""
+        conversation_id = conversation_data["id"]
+        topics = conversation_data.get("topics", []) or []
+        tags = conversation_data.get("tags", []) or []
+        topics_json = json.dumps(topics)
+
+        # Fold tags into topics_text so the existing FTS5 schema picks
+        # them up without needing a virtual-table rebuild. Precise
+        # tag-only lookups use the conversation_tags table below.
+        topics_text = " ".join(topics + tags)
+
+        custom_fields = conversation_data.get("custom_fields") or {}
+        custom_fields_json = json.dumps(custom_fields) if custom_fields else None
+
+        # Insert into main table
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO conversations
+            (id, title, content, date, created_at, file_path,
+             topics_json, topics_text, session_id, user_id,
+             conversation_type, custom_fields_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+            (
+                conversation_id,
+                conversation_data["title"],
+                conversation_data["content"],
+                conversation_data["date"],
+                conversation_data["created_at"],
+                file_path,
+                topics_json,
+                topics_text,
+                conversation_data.get("session_id"),
+                conversation_data.get("user_id"),
+                conversation_data.get("conversation_type"),
+                custom_fields_json,
+            ),
+        )
+
+        # Insert topics
+        conn.execute(
+            "DELETE FROM conversation_topics WHERE conversation_id = ?",
+            (conversation_id,),
+        )
+        conn.executemany(
+            "INSERT INTO conversation_topics (conversation_id, topic) VALUES (?, ?)",
+            [(conversation_id, topic) for topic in topics],
+        )
+
+        # Insert tags
+        conn.execute(
+            "DELETE FROM conversation_tags WHERE conversation_id = ?",
+            (conversation_id,),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO conversation_tags (conversation_id, tag) VALUES (?, ?)",
+            [(conversation_id, tag) for tag in tags if tag],
+        )
+
     def search_conversations(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search conversations using FTS5."""
         try:
@@ -262,16 +300,18 @@ class SearchDatabase:
             with sqlite3.connect(self.db_path) as conn:
                 conn.row_factory = sqlite3.Row
 
-                # Use FTS5 MATCH for full-text search
+                # Use FTS5 MATCH for full-text search. Column weights follow
+                # the linear scorer: a title hit counts 3x a content hit and
+                # a topic hit 5x; the id column never contributes.
                 cursor = conn.execute(
                     """
                     SELECT c.id, c.title, c.date, c.topics_json, c.file_path,
-                           bm25(conversations_fts) as score,
+                           bm25(conversations_fts, 0.0, 3.0, 1.0, 5.0) as score,
                            snippet(conversations_fts, 2, '<mark>', '</mark>', '...', 32) as preview
                     FROM conversations_fts
                     JOIN conversations c ON conversations_fts.id = c.id
                     WHERE conversations_fts MATCH ?
-                    ORDER BY bm25(conversations_fts)
+                    ORDER BY score
                     LIMIT ?
                 """,
                     (query_cleaned, limit),
@@ -509,6 +549,41 @@ class SearchDatabase:
             self.logger.exception(f"FTS index rebuild failed: {e}")
             raise
 
+    def get_conversation_ids(self) -> set[str]:
+        """Get the ids of every conversation currently in the database."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                return {row[0] for row in conn.execute("SELECT id FROM conversations")}
+
+        except sqlite3.Error as e:
+            self.logger.exception(f"Id query failed: {e}")
+            return set()
+
+    def get_sync_failures(self) -> dict[str, str]:
+        """Get the ``{id: file_stamp}`` of conversations the backfill gave up on."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                return dict(conn.execute("SELECT id, file_stamp FROM sync_failures"))
+
+        except sqlite3.Error as e:
+            self.logger.exception(f"Sync failure query failed: {e}")
+            return {}
+
+    def set_sync_failures(self, failures: dict[str, str]) -> bool:
+        """Replace the recorded backfill failures with ``{id: file_stamp}``."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("DELETE FROM sync_failures")
+                conn.executemany(
+                    "INSERT INTO sync_failures (id, file_stamp) VALUES (?, ?)", failures.items()
+                )
+                conn.commit()
+                return True
+
+        except sqlite3.Error as e:
+            self.logger.exception(f"Failed to record sync failures: {e}")
+            return False
+
     def get_conversation_count(self) -> int:
         """Get total conversation count."""
         try:
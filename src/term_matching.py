@@ -0,0 +1,65 @@
+"""Fixed-vocabulary substring matching for topic extraction.
+
+Both ConversationMemoryServer and the platform importers tag conversations
+by checking which terms from a fixed vocabulary occur in the lowercased
+content. With pyahocorasick available, one automaton pass over the content
+finds every term at once instead of one substring scan per term.
+
+Format sniffing looks for indicator words anywhere in a parsed export, keys
+included; lowered_json gives it the whole document as one lowercased
+buffer to search.
+"""
+
+import json
+from typing import Any
+
+import orjson
+
+# Pinned dependency, but a C extension: a platform without a wheel falls
+# back to one ``in`` scan per term instead of failing to import.
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+def build_term_automaton(terms: tuple[str, ...]) -> Any:
+    """Build an Aho-Corasick automaton over ``terms``, or None without the lib."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def find_terms(text: str, terms: tuple[str, ...], automaton: Any) -> list[str]:
+    """Return the members of ``terms`` that occur as substrings of ``text``.
+
+    Order follows ``terms``. Uses ``automaton`` (from build_term_automaton)
+    when available, else falls back to one substring scan per term. Matches
+    may overlap: "java" inside "javascript" counts, exactly like
+    ``"java" in text``.
+    """
+    if automaton is None:
+        return [term for term in terms if term in text]
+    matched = {term for _, term in automaton.iter(text)}
+    return [term for term in terms if term in matched]
+
+
+def lowered_json(data: Any) -> bytes:
+    """Serialize parsed JSON to lowercased bytes for indicator-word checks.
+
+    orjson serializes in well under half the time of ``json.dumps``, and
+    ``bytes.lower()`` only folds ASCII, so ASCII needles such as ``b"mcp"``
+    match the same documents they did against ``json.dumps(data).lower()``.
+    """
+    try:
+        return orjson.dumps(data).lower()
+    except orjson.JSONEncodeError:
+        # orjson refuses nesting deeper than 255 levels; json.dumps handles
+        # anything json.load could have produced
+        return json.dumps(data).lower().encode()
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""Tests for ConversationMemoryServer's JSON read/write helpers.
+
+The per-conversation read paths (linear search, get_preview, weekly
+summary, index sync) go through ``_load_json_file``, which parses with
+orjson and switches to an mmap-backed read above ``_MMAP_THRESHOLD``.
+These tests pin down that both branches return the same data and that
+malformed files still surface as ``ValueError`` -- the exception type every
+caller's ``except`` clause is written against. index.json/topics.json go
+through the stat-validated ``_read_json_cached`` instead.
+"""
+
+import json
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import conversation_memory  # noqa: E402
+from conversation_memory import ConversationMemoryServer  # noqa: E402
+
+
+@pytest.fixture
+def temp_storage():
+    d = tempfile.mkdtemp(prefix="claude_memory_json_io_test_")
+    yield d
+    shutil.rmtree(d, ignore_errors=True)
+
+
+@pytest.fixture
+def server(temp_storage):
+    return ConversationMemoryServer(temp_storage, enable_sqlite=False)
+
+
+class TestLoadJsonFile:
+    def test_small_file_round_trips(self, temp_storage):
+        path = Path(temp_storage) / "small.json"
+        data = {"id": "conv_1", "content": "héllo wörld", "topics": ["python"]}
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+        assert conversation_memory._load_json_file(path) == data
+
+    def test_large_file_uses_mmap_branch(self, temp_storage):
+        path = Path(temp_storage) / "large.json"
+        data = {"id": "conv_2", "content": "x" * (conversation_memory._MMAP_THRESHOLD * 2)}
+        path.write_text(json.dumps(data), encoding="utf-8")
+        assert path.stat().st_size >= conversation_memory._MMAP_THRESHOLD
+
+        assert conversation_memory._load_json_file(path) == data
+
+    @pytest.mark.parametrize("size_factor", [0, 2])
+    def test_invalid_json_raises_value_error(self, temp_storage, size_factor):
+        path = Path(temp_storage) / "bad.json"
+        path.write_text("{not json" + " " * conversation_memory._MMAP_THRESHOLD * size_factor)
+
+        with pytest.raises(ValueError, match="."):
+            conversation_memory._load_json_file(path)
+
+    def test_missing_file_raises_os_error(self, temp_storage):
+        with pytest.raises(OSError, match="missing.json"):
+            conversation_memory._load_json_file(Path(temp_storage) / "missing.json")
+
+
+class TestReadPathsUseLoader:
+    @pytest.mark.asyncio
+    async def test_linear_search_reads_large_conversation(self, server):
+        content = "python asyncio " + "filler " * 20000
+        await server.add_conversation(content, "Big conversation", "2025-01-15T10:00:00")
+
+        results = await server.search_conversations("asyncio")
+
+        assert len(results) == 1
+        assert results[0]["title"] == "Big conversation"
+
+    @pytest.mark.asyncio
+    async def test_get_preview_reads_large_conversation(self, server):
+        content = "python asyncio " + "filler " * 20000
+        await server.add_conversation(content, "Big conversation", "2025-01-15T10:00:00")
+        conv_id = json.loads(server.index_file.read_text())["conversations"][0]["id"]
+
+        preview = server.get_preview(conv_id)
+
+        assert preview.startswith("python asyncio")
+        assert preview.endswith("...")
+
+
+class TestIndexCache:
+    def test_repeated_reads_parse_once(self, server, monkeypatch):
+        server._read_json_cached(server.index_file)
+        calls = []
+        real_load = json.load
+        monkeypatch.setattr(json, "load", lambda f: calls.append(f) or real_load(f))
+
+        server.get_preview("conv_missing")
+        server.get_preview("conv_missing")
+
+        assert calls == []
+
+    def test_external_edit_is_picked_up(self, server):
+        server._read_json_cached(server.index_file)
+        server.index_file.write_text(
+            json.dumps({"conversations": [{"id": "conv_x"}], "last_updated": "now"})
+        )
+
+        index_data = server._read_json_cached(server.index_file)
+
+        assert [c["id"] for c in index_data["conversations"]] == ["conv_x"]
+
+    @pytest.mark.asyncio
+    async def test_writes_refresh_cached_copy(self, server):
+        await server.add_conversation("python asyncio", "First", "2025-01-15T10:00:00")
+
+        cached = server._read_json_cached(server.index_file)
+
+        assert cached == json.loads(server.index_file.read_text())
+        assert [c["title"] for c in cached["conversations"]] == ["First"]
+
+    def test_failed_write_drops_cached_copy(self, server):
+        server._read_json_cached(server.index_file)
+        original = server.index_file.read_bytes()
+
+        with pytest.raises(TypeError, match="."):
+            server._write_json_cached(server.index_file, {"conversations": [object()]})
+
+        assert server.index_file not in server._json_cache
+        # Serialization fails before the file is opened, so it's untouched
+        assert server.index_file.read_bytes() == original
+
+    def test_written_index_is_compact_utf8(self, server):
+        data = {"conversations": [{"id": "conv_1", "title": "Café notes"}], "last_updated": "x"}
+
+        server._write_json_cached(server.index_file, data)
+
+        written = server.index_file.read_text(encoding="utf-8")
+        assert written == json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+class TestConversationFileLayout:
+    @pytest.mark.asyncio
+    async def test_conversation_file_keeps_indented_layout(self, server):
+        result = await server.add_conversation(
+            "Café notes", "Notes", "2025-01-15T10:00:00", custom_fields={"k": 1}
+        )
+
+        written = Path(result["file_path"]).read_text(encoding="utf-8")
+        assert written == json.dumps(json.loads(written), indent=2, ensure_ascii=False)
+
+    @pytest.mark.asyncio
+    async def test_unserializable_field_leaves_no_file(self, server):
+        result = await server.add_conversation(
+            "body", "Bad", "2025-01-15T10:00:00", custom_fields={"k": object()}
+        )
+
+        assert result["status"] == "error"
+        assert list(server.conversations_path.rglob("conv_*.json")) == []
+
+
+class TestIndexedPreview:
+    @pytest.mark.asyncio
+    async def test_get_preview_served_from_index_entry(self, server, monkeypatch):
+        await server.add_conversation("short body", "Short", "2025-01-15T10:00:00")
+        conv_id = server._read_json_cached(server.index_file)["conversations"][0]["id"]
+
+        def fail_load(path):
+            raise AssertionError(f"unexpected read of {path}")
+
+        monkeypatch.setattr(conversation_memory, "_load_json_file", fail_load)
+
+        assert server.get_preview(conv_id) == "short body"
+
+    @pytest.mark.asyncio
+    async def test_deleted_file_is_not_previewed(self, server):
+        content = "python " * 10
+        await server.add_conversation(content, "Gone", "2025-01-15T10:00:00")
+        entry = server._read_json_cached(server.index_file)["conversations"][0]
+        (server.storage_path / entry["file_path"]).unlink()
+
+        assert server.get_preview(entry["id"]) == "Conversation file not found"
+        assert await server.search_by_topic("python") == []
+
+    @pytest.mark.asyncio
+    async def test_long_conversation_indexes_a_cut_preview(self, server):
+        await server.add_conversation("x" * 600, "Long", "2025-01-15T10:00:00")
+        entry = server._read_json_cached(server.index_file)["conversations"][0]
+
+        assert entry["preview"] == "x" * 200 + "..."
+        assert server.get_preview(entry["id"]) == "x" * 500 + "..."
+
+    @pytest.mark.asyncio
+    async def test_topic_search_served_from_index_entries(self, server, monkeypatch):
+        content = "python " * 100
+        await server.add_conversation(content, "Long", "2025-01-15T10:00:00")
+        conv_id = server._read_json_cached(server.index_file)["conversations"][0]["id"]
+
+        def fail_load(path):
+            raise AssertionError(f"unexpected read of {path}")
+
+        monkeypatch.setattr(conversation_memory, "_load_json_file", fail_load)
+
+        results = await server.search_by_topic("python")
+
+        assert results == [{"id": conv_id, "preview": content[:200] + "..."}]
+
+    @pytest.mark.asyncio
+    async def test_update_refreshes_indexed_preview(self, server):
+        await server.add_conversation("old text", "Doc", "2025-01-15T10:00:00")
+        entry = server._read_json_cached(server.index_file)["conversations"][0]
+
+        await server.update_conversation(entry["id"], content="new text")
+
+        stored = json.loads((server.storage_path / entry["file_path"]).read_text())
+        assert server.get_preview(entry["id"]) == stored["content"]
+        assert "new text" in stored["content"]
+
+    @pytest.mark.asyncio
+    async def test_entry_without_preview_reads_file(self, server):
+        await server.add_conversation("legacy body", "Old", "2025-01-15T10:00:00")
+        index_data = json.loads(server.index_file.read_text())
+        del index_data["conversations"][0]["preview"]
+        server.index_file.write_text(json.dumps(index_data))
+
+        assert server.get_preview(index_data["conversations"][0]["id"]) == "legacy body"
@@ -106,6 +106,57 @@ class TestWeeklySummaryGeneration:
         assert "Popular Topics" in summary
         assert "python" in summary.lower()
 
+    @pytest.mark.asyncio
+    async def test_week_conversations_filtered_by_day_in_index_order(self, server):
+        """Week lookup keeps index order and sees entries added later"""
+        for title, date in [
+            ("Wed", "2025-01-15T09:00:00"),
+            ("Prev Sun", "2025-01-12T23:59:00"),
+            ("Mon", "2025-01-13T00:00:00Z"),
+            ("Next Mon", "2025-01-20T00:00:00"),
+        ]:
+            await server.add_conversation(f"{title} notes", title, date)
+        start, end = datetime(2025, 1, 13, 12), datetime(2025, 1, 19, 12)
+
+        week = server._get_week_conversations(start, end)
+        assert [c["title"] for c in week] == ["Wed", "Mon"]
+
+        await server.add_conversation("Sun notes", "Sun", "2025-01-19T23:00:00+05:00")
+        week = server._get_week_conversations(start, end)
+        assert [c["title"] for c in week] == ["Wed", "Mon", "Sun"]
+
+    @pytest.mark.asyncio
+    async def test_day_index_rebuilt_when_cache_entry_dropped(self, server):
+        """A cache entry dropped mid-summary rebuilds the day view"""
+        await server.add_conversation("Mon notes", "Mon", "2025-01-13T10:00:00")
+        conversations = server._read_json_cached(server.index_file)["conversations"]
+        server._invalidate_json_cache(server.index_file)
+
+        days, positions = server._index_by_day(conversations)
+
+        assert days == [datetime(2025, 1, 13).date()]
+        assert positions == [0]
+
+    def test_weekly_summary_topic_counts_and_tie_order(self, server):
+        """Popular topics are ranked by count, ties in first-seen order"""
+        conversations = [
+            {"title": "A", "date": "2025-01-13T09:00:00", "topics": ["go", "rust"]},
+            {"title": "B", "date": "2025-01-14T09:00:00", "topics": ["rust", "zig"]},
+            {"title": "C", "date": "2025-01-15T09:00:00", "topics": ["zig", "a", "b", "c"]},
+        ]
+
+        summary = server._build_weekly_summary_text(
+            datetime(2025, 1, 13), datetime(2025, 1, 19), conversations
+        )
+
+        popular = summary.split("## Popular Topics\n")[1].split("\n\n")[0].splitlines()
+        assert popular[:3] == [
+            "- rust: 2 conversations",
+            "- zig: 2 conversations",
+            "- go: 1 conversations",
+        ]
+        assert "- [2025-01-15] C *Topics: zig, a, b...*" in summary
+
     @pytest.mark.asyncio
     async def test_weekly_summary_categorization(self, server):
         """Test that conversations are categorized correctly"""
@@ -7,6 +7,7 @@ Tests automatic platform detection for AI conversation exports.
 
 import json
 import tempfile
+import time
 from pathlib import Path
 
 from format_detector import FormatDetector, PlatformType
@@ -26,6 +27,10 @@ class TestFormatDetector:
         detector = FormatDetector()
         assert detector.logger is not None
 
+    def test_detector_is_stateless(self):
+        """FormatDetector keeps no per-instance state."""
+        assert not hasattr(FormatDetector(), "__dict__")
+
     def test_detect_format_nonexistent_file(self):
         """Test detection with non-existent file."""
         non_existent = self.temp_path / "does_not_exist.json"
@@ -34,6 +39,13 @@ class TestFormatDetector:
         assert result["platform"] == PlatformType.UNKNOWN.value
         assert result["confidence"] == 0.0
 
+    def test_result_timestamp_is_detection_time(self):
+        """The result timestamp records when detection ran."""
+        before = time.time()
+        result = self.detector.detect_format(self.temp_path / "does_not_exist.json")
+
+        assert before <= result["timestamp"] <= time.time()
+
     def test_detect_format_chatgpt_export(self):
         """Test detection of ChatGPT export format."""
         chatgpt_data = {
@@ -275,6 +287,14 @@ class TestFormatDetectorValidationMethods:
         result = self.detector._is_claude_memory_format(data)
         assert result is True
 
+    def test_is_claude_memory_format_needs_five_indicators(self):
+        """Four matching fields alone are not enough without a conv_ ID."""
+        data = {"id": "other-id", "title": "t", "content": "c", "date": "d", "extra": 1}
+        assert self.detector._is_claude_memory_format(data) is False
+
+        data["topics"] = []
+        assert self.detector._is_claude_memory_format(data) is True
+
     def test_is_claude_desktop_format_valid(self):
         """Test _is_claude_desktop_format with valid data."""
         data = {
@@ -286,6 +306,26 @@ class TestFormatDetectorValidationMethods:
         # Implementation may require specific fields - adjust based on actual requirements
         assert isinstance(result, bool)
 
+    def test_is_claude_desktop_format_counts_nested_keys_and_values(self):
+        """Indicators are found in nested keys/values, each counted once."""
+        nested = {"meta": {"Client": [{"MCP_Server": "on"}, "Claude Desktop"]}}
+        assert self.detector._is_claude_desktop_format(nested) is True
+
+        # One indicator repeated is still one indicator
+        assert self.detector._is_claude_desktop_format({"a": "mcp", "b": ["MCP"]}) is False
+
+        # Conversation structure counts as the second indicator
+        assert self.detector._is_claude_desktop_format({"content": "via MCP"}) is True
+
+    def test_is_claude_desktop_format_deeply_nested(self):
+        """Nesting past orjson's 255-level limit is still searched."""
+        data: dict = {"x": "claude"}
+        for _ in range(300):
+            data = {"x": [data]}
+        data["y"] = "anthropic"
+
+        assert self.detector._is_claude_desktop_format(data) is True
+
     def test_has_role_based_messages_valid(self):
         """Test _has_role_based_messages with valid messages."""
         messages = [
@@ -320,6 +360,10 @@ class TestFormatDetectorValidationMethods:
         result = self.detector._has_conversation_structure(data)
         assert result is False
 
+    def test_has_conversation_structure_text_field_only(self):
+        """A plain text field alone counts as conversation structure."""
+        assert self.detector._has_conversation_structure({"response": "Hi"}) is True
+
 
 class TestFormatDetectorErrorHandling:
     """Test FormatDetector error handling."""
@@ -455,6 +499,21 @@ What would you like to work on?
         assert result["platform"] == PlatformType.UNKNOWN.value
         assert result["confidence"] == 0.0
 
+    def test_detect_text_format_reads_only_prefix(self):
+        """Only the leading prefix of a text file is used for detection."""
+        from format_detector import _TEXT_DETECTION_PREFIX_CHARS
+
+        markers = "**Human**: Hi\n\n**Claude**: Hello\n"
+        filler = "x" * _TEXT_DETECTION_PREFIX_CHARS
+
+        head_file = self.temp_path / "head.md"
+        head_file.write_text(markers + filler)
+        assert self.detector.detect_format(head_file)["platform"] == PlatformType.CLAUDE_WEB.value
+
+        tail_file = self.temp_path / "tail.md"
+        tail_file.write_text(filler + markers)
+        assert self.detector.detect_format(tail_file)["platform"] == PlatformType.UNKNOWN.value
+
 
 class TestFormatDetectorIntegration:
     """Test FormatDetector integration scenarios."""
@@ -66,6 +66,30 @@ class TestImportResult:
         assert result.imported_ids == ["id1", "id2", "id3"]
         assert result.metadata == {"source": "test"}
 
+    def test_import_result_failed(self):
+        """ImportResult.failed builds a whole-file failure with one error."""
+        result = ImportResult.failed("File not found: x.json")
+
+        assert result.success is False
+        assert result.conversations_imported == 0
+        assert result.conversations_failed == 1
+        assert result.errors == ["File not found: x.json"]
+        assert result.imported_ids == []
+        assert result.metadata == {}
+
+    def test_import_result_has_no_instance_dict(self):
+        """ImportResult uses slots, so instances carry no per-instance dict."""
+        result = ImportResult(
+            success=True,
+            conversations_imported=0,
+            conversations_failed=0,
+            errors=[],
+            imported_ids=[],
+            metadata={},
+        )
+
+        assert not hasattr(result, "__dict__")
+
     def test_import_result_success_rate(self):
         """Test success rate calculation."""
         result = ImportResult(
@@ -175,6 +199,27 @@ class TestBaseImporter:
         assert "import_metadata" in conversation
         assert conversation["import_metadata"]["source_format"] == "test"
 
+    def test_generate_conversation_id_format(self):
+        """Conversation IDs are conv_<timestamp>_<8 hex chars>."""
+        conv_id = self.importer._generate_conversation_id(datetime(2025, 1, 15, 12, 0, 0))
+
+        prefix, suffix = conv_id.rsplit("_", 1)
+        assert prefix == "conv_20250115_120000"
+        assert len(suffix) == 8
+        assert int(suffix, 16) >= 0
+
+    def test_get_month_folder_creates_each_month_once(self, monkeypatch):
+        """Month folders are created on first use and reused afterwards."""
+        jan = self.importer._get_month_folder(datetime(2025, 1, 15))
+        assert jan == self.storage_path / "2025" / "01-january"
+        assert jan.is_dir()
+
+        def fail_mkdir(*args, **kwargs):
+            raise AssertionError("mkdir called for a known month")
+
+        monkeypatch.setattr(Path, "mkdir", fail_mkdir)
+        assert self.importer._get_month_folder(datetime(2025, 1, 31, 23, 59)) == jan
+
     def test_create_message(self):
         """Test message creation utility."""
         timestamp = datetime.now()
@@ -236,6 +281,21 @@ class TestBaseImporter:
         assert isinstance(parsed, datetime)
         assert abs((datetime.now() - parsed).total_seconds()) < 5
 
+    def test_parse_timestamp_fast_path_matches_formats(self):
+        """The fromisoformat fast path accepts only what the formats accept."""
+        assert self.importer._parse_timestamp("2025-01-15T12:30:45.5Z") == datetime(
+            2025, 1, 15, 12, 30, 45, 500000
+        )
+        assert self.importer._parse_timestamp("2025-01-15 12:30:45") == datetime(
+            2025, 1, 15, 12, 30, 45
+        )
+        assert self.importer._parse_timestamp("2025-01-15") == datetime(2025, 1, 15)
+
+        # fromisoformat alone would accept these; the old formats did not
+        for lenient in ("2025-01-15T12:30:45+05:00", "20250115", "2025-01-15T12"):
+            parsed = self.importer._parse_timestamp(lenient)
+            assert abs((datetime.now() - parsed).total_seconds()) < 5
+
     def test_extract_topics_basic(self):
         """Test basic topic extraction."""
         content = "This is about Python programming and machine learning AI."
@@ -246,6 +306,21 @@ class TestBaseImporter:
         assert "machine learning" in topics
         assert "ai" in topics
 
+    def test_extract_topics_no_duplicate_platform_topic(self):
+        """A platform name that is also a matched term is listed once."""
+        self.importer.platform_name = "python"
+        topics = self.importer._extract_topics("python and more python")
+
+        assert topics == ["python"]
+
+    def test_extract_topics_uses_given_lowercase_content(self):
+        """A precomputed content_lower is matched instead of lowercasing again."""
+        content = "Python and Docker"
+        topics = self.importer._extract_topics(content, content.lower())
+
+        assert topics == self.importer._extract_topics(content)
+        assert "docker" in self.importer._extract_topics(content, "docker")
+
     def test_extract_topics_quoted_terms(self):
         """Test topic extraction with quoted terms."""
         content = 'Discussion about "neural network" and "machine learning" concepts.'
@@ -254,6 +329,18 @@ class TestBaseImporter:
         # The BaseImporter looks for individual terms, not quoted phrases
         assert "machine learning" in topics  # This is in the predefined list
 
+    def test_extract_topics_same_without_automaton(self, monkeypatch):
+        """The substring fallback finds the same topics as the automaton."""
+        from importers import base_importer
+
+        content = "JavaScript APIs on AWS with Docker; ios and android apps"
+        with_automaton = self.importer._extract_topics(content)
+        monkeypatch.setattr(base_importer, "_TECH_TOPICS_AUTOMATON", None)
+
+        assert sorted(self.importer._extract_topics(content)) == sorted(with_automaton)
+        # Overlapping terms still match, like the ``in`` check they replace
+        assert {"java", "javascript", "api", "aws", "ios"} <= set(with_automaton)
+
     def test_extract_topics_limit(self):
         """Test topic extraction respects limit."""
         # Create content with many potential topics
@@ -269,6 +269,22 @@ class TestChatGPTImporter:
         assert result.metadata["platform"] == "chatgpt"
         assert result.metadata["import_format"] == "openai_export"
 
+    @pytest.mark.parametrize(
+        ("field", "value"),
+        [("score", float("nan")), ("score", float("inf")), ("title", "Cut emoji \ud83d")],
+    )
+    def test_import_file_accepts_what_json_load_accepts(self, field, value):
+        """NaN/Infinity and lone surrogate escapes don't fail the whole export."""
+        self.valid_export["conversations"][0][field] = value
+        export_file = self.storage_path / "export.json"
+        export_file.write_text(json.dumps(self.valid_export))
+
+        with patch.object(self.importer, "_save_conversation"):
+            result = self.importer.import_file(export_file)
+
+        assert result.success is True
+        assert result.conversations_imported == 2
+
     def test_import_file_general_exception(self):
         """Test import file with general exception."""
         valid_file = self.storage_path / "valid.json"
@@ -304,6 +320,22 @@ class TestChatGPTImporter:
             saved_data = json.load(f)
         assert saved_data == conversation
 
+    def test_save_conversation_matches_json_dump_layout(self):
+        """Saved files keep the json.dump(indent=2, ensure_ascii=False) layout."""
+        conversation = {
+            "id": "conv_test_456",
+            "date": "2025-01-15T10:30:00Z",
+            "content": "Café ✓",
+            "topics": [],
+            "messages": [{"role": "user", "content": "héllo"}],
+        }
+
+        file_path = self.importer._save_conversation(conversation)
+
+        assert file_path.read_text(encoding="utf-8") == json.dumps(
+            conversation, indent=2, ensure_ascii=False
+        )
+
     def test_extract_topics_chatgpt_specific(self):
         """Test ChatGPT-specific topic extraction."""
         content = "This is about OpenAI and GPT models for AI development."
@@ -331,6 +363,18 @@ class TestChatGPTImporter:
 
         assert len(topics) <= 10
 
+    def test_extract_topics_same_without_automaton(self, monkeypatch):
+        """The substring fallback yields the same topics, in the same order."""
+        from importers import base_importer, chatgpt_importer
+
+        content = "Prompt tips for an OpenAI GPT chatbot built in Python"
+        with_automaton = self.importer._extract_topics(content)
+        monkeypatch.setattr(base_importer, "_TECH_TOPICS_AUTOMATON", None)
+        monkeypatch.setattr(chatgpt_importer, "_CHATGPT_TOPICS_AUTOMATON", None)
+
+        assert self.importer._extract_topics(content) == with_automaton
+        assert {"openai", "gpt", "prompt", "chatbot", "python"} <= set(with_automaton)
+
 
 class TestChatGPTImporterEdgeCases:
     """Test edge cases and error conditions for ChatGPT importer."""
@@ -352,6 +396,64 @@ class TestChatGPTImporterEdgeCases:
         conversation = self.importer.parse_conversation(conv_data)
         assert conversation["title"] == "Untitled ChatGPT Conversation"
 
+    def test_parse_conversation_role_labels(self):
+        """Common roles get fixed labels; other roles are title-cased."""
+        conv_data = {
+            "id": "test_conv",
+            "create_time": "2025-01-15T10:00:00Z",
+            "messages": [
+                {"role": "user", "content": "Hi"},
+                {"role": "assistant", "content": "Hello"},
+                {"role": "system", "content": "Be brief"},
+                {"role": "tool", "content": "42"},
+            ],
+        }
+
+        conversation = self.importer.parse_conversation(conv_data)
+
+        assert conversation["content"] == (
+            "**Human**: Hi\n\n**Assistant**: Hello\n\n**System**: Be brief\n\n**Tool**: 42"
+        )
+
+    def test_parse_conversation_parses_each_timestamp_once(self):
+        """Repeated timestamp strings within a conversation are parsed once."""
+        conv_data = {
+            "id": "test_conv",
+            "create_time": "2025-01-15T10:00:00Z",
+            "messages": [
+                {"role": "user", "content": "Hi", "create_time": "2025-01-15T10:00:00Z"},
+                {"role": "assistant", "content": "Hello", "create_time": "2025-01-15T10:00:05Z"},
+                {"role": "user", "content": "Again", "create_time": "2025-01-15T10:00:05Z"},
+                {"role": "assistant", "content": "Sure"},
+            ],
+        }
+
+        with patch.object(
+            self.importer, "_parse_timestamp", wraps=self.importer._parse_timestamp
+        ) as parse:
+            conversation = self.importer.parse_conversation(conv_data)
+
+        assert parse.call_count == 2
+        timestamps = [msg["timestamp"] for msg in conversation["messages"]]
+        assert timestamps == [
+            "2025-01-15T10:00:00",
+            "2025-01-15T10:00:05",
+            "2025-01-15T10:00:05",
+            "2025-01-15T10:00:00",
+        ]
+
+    @pytest.mark.parametrize("msg_time", [None, "", "missing"])
+    def test_parse_conversation_message_without_timestamp(self, msg_time):
+        """A null, empty or missing message timestamp uses the conversation date."""
+        message = {"role": "user", "content": "hi"}
+        if msg_time != "missing":
+            message["create_time"] = msg_time
+        conv_data = {"id": "x", "create_time": "2025-01-01T12:00:00", "messages": [message]}
+
+        conversation = self.importer.parse_conversation(conv_data)
+
+        assert [msg["timestamp"] for msg in conversation["messages"]] == ["2025-01-01T12:00:00"]
+
     def test_parse_conversation_invalid_timestamps(self):
         """Test parsing conversation with invalid timestamps."""
         conv_data = {
@@ -12,6 +12,7 @@ from unittest.mock import patch
 
 import pytest  # type: ignore[import-not-found]
 
+from importers import claude_importer
 from importers.claude_importer import ClaudeImporter
 
 
@@ -136,6 +137,62 @@ class TestClaudeImporterJSONFormat:
         assert result.conversations_failed == 0
         assert result.metadata["format"] == "claude_generic_json"
 
+    @pytest.mark.parametrize("value", [float("nan"), float("-inf"), "Cut emoji \ud83d"])
+    def test_import_json_accepts_what_json_load_accepts(self, value):
+        """NaN/Infinity and lone surrogate escapes don't reject the file."""
+        test_file = self.storage_path / "odd.json"
+        test_file.write_text(json.dumps({"title": "Notes", "content": "text", "extra": value}))
+
+        with patch.object(self.importer, "_save_conversation"):
+            result = self.importer.import_file(test_file)
+
+        assert result.success is True
+        assert result.conversations_imported == 1
+
+    def test_import_json_serializes_once_for_format_and_variant(self):
+        """Desktop detection and variant detection share one serialization."""
+        desktop_data = {
+            "title": "MCP session",
+            "content": "**Human**: hi\n\n**Claude**: hello from Claude Desktop",
+            "source": "anthropic desktop",
+        }
+        test_file = self.storage_path / "desktop.json"
+        test_file.write_text(json.dumps(desktop_data))
+
+        with (
+            patch(
+                "importers.claude_importer.lowered_json", wraps=claude_importer.lowered_json
+            ) as lowered_json,
+            patch.object(self.importer, "_save_conversation"),
+        ):
+            result = self.importer.import_file(test_file)
+
+        assert result.success is True
+        assert result.metadata["format"] == "claude_desktop"
+        lowered_json.assert_called_once()
+
+    def test_import_json_checks_memory_format_once(self):
+        """Variant detection reuses the memory-format verdict from format detection."""
+        test_file = self.storage_path / "plain.json"
+        test_file.write_text(json.dumps({"title": "Notes", "content": "plain text"}))
+
+        with (
+            patch.object(
+                self.importer,
+                "_is_claude_memory_format",
+                wraps=self.importer._is_claude_memory_format,
+            ) as is_memory,
+            patch.object(self.importer, "_save_conversation"),
+        ):
+            result = self.importer.import_file(test_file)
+
+        assert result.success is True
+        is_memory.assert_called_once()
+        assert self.importer.parse_conversation({"title": "Notes"})["session_context"] == {
+            "claude_variant": "claude_generic",
+            "original_format": "claude_json",
+        }
+
 
 class TestClaudeImporterTextFormat:
     """Test ClaudeImporter text format handling."""
@@ -231,6 +288,13 @@ class TestClaudeImporterParsingMethods:
         result = self.importer._is_claude_memory_format(data)
         assert result is False
 
+    def test_detect_claude_format_non_dict(self):
+        """Top-level JSON arrays are never treated as a single conversation."""
+        data = ["id", "title", "content", "date", "topics", "created_at", "messages"]
+
+        assert self.importer._is_claude_memory_format(data) is False
+        assert self.importer._has_conversation_structure(data) is False
+
 
 class TestClaudeImporterSaveConversation:
     """Test ClaudeImporter conversation saving."""
@@ -266,6 +330,98 @@ class TestClaudeImporterSaveConversation:
         assert saved_data["id"] == conversation["id"]
         assert saved_data["platform"] == "claude"
 
+    def test_save_conversation_matches_json_dump_layout(self):
+        """Saved files keep the json.dump(indent=2, ensure_ascii=False) layout."""
+        conversation = {
+            "id": "claude_20250115_120000_abcd5678",
+            "date": "2025-01-15T12:00:00",
+            "title": "Café ✓",
+            "messages": [{"role": "user", "content": "héllo"}],
+        }
+
+        file_path = self.importer._save_conversation(conversation)
+
+        assert file_path.read_text(encoding="utf-8") == json.dumps(
+            conversation, indent=2, ensure_ascii=False
+        )
+
+    def test_detect_claude_variant_sniffs_keys_and_nested_values(self):
+        """Indicator words match case-insensitively anywhere in the document."""
+        assert (
+            self.importer._detect_claude_variant({"meta": {"Source": ["Claude DESKTOP"]}})
+            == "claude_desktop"
+        )
+        assert self.importer._detect_claude_variant({"Browser_Session": "ünïcode"}) == "claude_web"
+        assert (
+            self.importer._detect_claude_variant({"title": "Café", "content": "plain"})
+            == "claude_generic"
+        )
+
+    def test_extract_messages_from_markdown_in_text_order(self):
+        """Messages come back in conversation order, with roles from their markers."""
+        content = (
+            "**Human**: First question\n\n"
+            "**Claude**: The human asked a question\n\n"
+            "**Human**:\n\n"
+            "human: plain follow-up\n"
+            "CLAUDE: last reply\n"
+        )
+
+        messages = self.importer._extract_messages_from_markdown(content)
+
+        assert [(m["role"], m["content"]) for m in messages] == [
+            ("user", "First question"),
+            ("assistant", "The human asked a question"),
+            ("user", "plain follow-up"),
+            ("assistant", "last reply"),
+        ]
+
+    def test_extract_topics_lists_each_topic_once(self):
+        """Claude terms already found by the base extraction aren't repeated."""
+        topics = self.importer._extract_topics("Claude and Anthropic discuss Python reasoning")
+
+        assert topics.count("claude") == 1
+        assert len(topics) == len(set(topics))
+        assert {"python", "claude", "anthropic", "reasoning"} <= set(topics)
+
+    def test_parse_markdown_conversation_shares_lowercased_content(self):
+        """Message and topic extraction reuse one lowercased copy of the content."""
+        content = "# Chat\n\n**Human**: Any Python tips?\n\n**Claude**: Some reasoning."
+
+        with (
+            patch.object(
+                self.importer,
+                "_extract_messages_from_markdown",
+                wraps=self.importer._extract_messages_from_markdown,
+            ) as extract_messages,
+            patch.object(
+                self.importer, "_extract_topics", wraps=self.importer._extract_topics
+            ) as extract_topics,
+        ):
+            conversation = self.importer._parse_markdown_conversation(content)
+
+        assert extract_messages.call_args.args == (content, content.lower())
+        assert extract_topics.call_args.args == (content, content.lower())
+        assert {"python", "claude", "reasoning"} <= set(conversation["topics"])
+        assert len(conversation["messages"]) == 2
+
+    def test_extract_messages_from_markdown_without_markers(self):
+        """Text with no speaker marker yields no messages."""
+        with patch("importers.claude_importer._SPEAKER_MARKER_RE") as mock_re:
+            assert self.importer._extract_messages_from_markdown("Just some notes.") == []
+        mock_re.finditer.assert_not_called()
+
+    def test_extract_messages_from_markdown_when_lowercasing_changes_length(self):
+        """ "İ" lowercases to two characters; message boundaries must not shift."""
+        content = "İstanbul trip\n\n**Human**: İzmir too?\n\nClaude: Yes, İzmir."
+
+        messages = self.importer._extract_messages_from_markdown(content)
+
+        assert [(m["role"], m["content"]) for m in messages] == [
+            ("user", "İzmir too?"),
+            ("assistant", "Yes, İzmir."),
+        ]
+
 
 class TestClaudeImporterIntegration:
     """Test ClaudeImporter integration scenarios."""
@@ -180,6 +180,14 @@ class TestStandaloneMemoryServer:
 
         assert len(topics_data["topics"]) > 0
 
+    def test_topics_index_update_uses_one_timestamp(self, standalone_server):
+        """All entries written by one topics-index update share its timestamp"""
+        standalone_server._update_topics_index(["alpha", "beta", "gamma"], "conv_x")
+
+        topics_data = json.loads(standalone_server.topics_file.read_text())
+        stamps = {topics_data["topics"][t][0]["added_at"] for t in ("alpha", "beta", "gamma")}
+        assert stamps == {topics_data["last_updated"]}
+
     @pytest.mark.asyncio
     async def test_date_folder_organization(self, standalone_server, sample_conversation_content):
         """Test that conversations are organized by date"""
@@ -221,6 +229,36 @@ class TestStandaloneMemoryServer:
         high_score_found = any(r["title"] == "High Score Conversation" for r in results)
         assert high_score_found
 
+    @pytest.mark.asyncio
+    async def test_linear_search_top_results_order(self, temp_storage):
+        """Linear search returns the highest scores first, ties in index order"""
+        server = StandaloneServer(temp_storage, enable_sqlite=False)
+        for title, content in [
+            ("One", "widget"),
+            ("Three", "widget widget widget"),
+            ("Two A", "widget widget"),
+            ("Two B", "widget widget"),
+        ]:
+            await server.add_conversation(content, title, "2025-01-15T10:00:00")
+
+        results = await server.search_conversations("widget", limit=3)
+
+        assert [r["title"] for r in results] == ["Three", "Two A", "Two B"]
+
+    @pytest.mark.asyncio
+    async def test_linear_search_reads_more_files_than_shards(self, temp_storage):
+        """Sharded file reads still find every match, in index order"""
+        import conversation_memory
+
+        server = StandaloneServer(temp_storage, enable_sqlite=False)
+        count = conversation_memory._SEARCH_SHARDS * 2 + 3
+        for i in range(count):
+            await server.add_conversation("shared gadget", f"Conv {i}", "2025-01-15T10:00:00")
+
+        results = await server.search_conversations("gadget", limit=count)
+
+        assert [r["title"] for r in results] == [f"Conv {i}" for i in range(count)]
+
     @pytest.mark.asyncio
     async def test_empty_search(self, standalone_server):
         """Test searching when no conversations exist"""
@@ -305,6 +343,18 @@ class TestStandaloneMemoryServer:
         # Should return empty or handle gracefully without crashing
         assert isinstance(results, list)
 
+    @pytest.mark.asyncio
+    async def test_search_skips_missing_file_keeps_others(self, temp_storage):
+        """A deleted conversation file is skipped; the rest still match"""
+        server = StandaloneServer(temp_storage, enable_sqlite=False)
+        gone = await server.add_conversation("gizmo notes", "Gone", "2025-01-15T10:00:00")
+        await server.add_conversation("gizmo notes", "Kept", "2025-01-15T10:00:00")
+        Path(gone["file_path"]).unlink()
+
+        results = await server.search_conversations("gizmo", limit=5)
+
+        assert [r["title"] for r in results] == ["Kept"]
+
     @pytest.mark.asyncio
     async def test_invalid_date_handling(self, standalone_server, sample_conversation_content):
         """Test that invalid dates are handled gracefully"""
@@ -380,6 +430,43 @@ class TestCoverageTarget:
         assert "bb" not in topics
         assert "longer term" in topics
 
+    def test_topic_extraction_order_and_cap(self, standalone_server):
+        """Tech terms, then quoted terms, then capitalized words; at most 10"""
+        content = (
+            "Capone Bravo 'single one' docker \"double one\" Charlie "
+            + " ".join(f"Term{letter}" for letter in "ABCDEFGHIJ")
+            + " python"
+        )
+
+        topics = standalone_server._extract_topics(content)
+
+        assert topics == [
+            "python",
+            "docker",
+            "double one",
+            "single one",
+            "capone",
+            "bravo",
+            "charlie",
+            "terma",
+            "termb",
+            "termc",
+        ]
+
+    def test_topic_extraction_without_automaton(self, standalone_server, monkeypatch):
+        """The substring-scan fallback finds the same terms as the automaton"""
+        import conversation_memory
+
+        content = "JavaScript on GitHub with machine learning and kubernetes"
+        with_automaton = standalone_server._extract_topics(content)
+        monkeypatch.setattr(conversation_memory, "_TECH_TERMS_AUTOMATON", None)
+        without_automaton = standalone_server._extract_topics(content)
+
+        assert with_automaton == without_automaton
+        # Overlapping terms are all reported, as with a plain ``in`` test
+        for term in ("javascript", "java", "github", "git", "machine learning"):
+            assert term in without_automaton
+
     def test_get_date_folder(self, standalone_server):
         """Test date folder generation"""
         test_date = datetime(2025, 12, 25, 15, 30, 45)
@@ -433,6 +520,22 @@ Line 5: Final line
         assert len(preview) > 0
         assert "search term" in preview.lower() or "term" in preview.lower()
 
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("l0\nl1\nl2\nl3 Needle\nl4\nl5\nl6", "l1\nl2\nl3 Needle\nl4\nl5"),
+            ("Needle first\nl1\nl2\nl3\nl4", "Needle first\nl1\nl2"),
+            ("l0\nl1\nl2\nneedle last", "l1\nl2\nneedle last"),
+            ("l0\nl1", ""),
+        ],
+    )
+    def test_get_preview_context_window(self, standalone_server, temp_storage, text, expected):
+        """Preview is the first matching line plus up to two lines either side"""
+        file_path = Path(temp_storage) / "preview.txt"
+        file_path.write_text(text, encoding="utf-8")
+
+        assert standalone_server._get_preview(file_path, ["absent", "needle"]) == expected
+
 
 class TestServerIntegration:
     """Integration tests for the memory server"""
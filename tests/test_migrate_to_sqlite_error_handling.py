@@ -85,7 +85,7 @@ def test_migrate_all_conversations_reports_error_on_malformed_index_json(temp_st
 def test_migrate_single_conversation_skips_entry_missing_file_path_and_keeps_batch_going(
     temp_storage,
 ):
-    """_migrate_single_conversation's except (line ~162) must catch a real
+    """_load_indexed_conversation's except must catch a real
     KeyError from an index entry that's missing the required "file_path"
     key -- e.g. a hand-edited or partially-written index.json -- and skip
     just that entry, not abort the whole migration. Verified end-to-end
@@ -103,7 +103,7 @@ def test_migrate_single_conversation_skips_entry_missing_file_path_and_keeps_bat
             },
             {
                 # Missing "file_path" entirely -> conv_info["file_path"]
-                # raises a real KeyError inside _migrate_single_conversation.
+                # raises a real KeyError inside _load_indexed_conversation.
                 "id": "conv_malformed",
             },
         ]
@@ -120,7 +120,7 @@ def test_migrate_single_conversation_skips_entry_missing_file_path_and_keeps_bat
 
 
 def test_migrate_json_file_skips_unparseable_file_and_keeps_batch_going(temp_storage):
-    """_migrate_json_file's except (line ~195) must catch a real
+    """_load_conversation_file's except must catch a real
     json.JSONDecodeError from a genuinely corrupt file on disk (not a
     mock) during the no-index directory scan, and skip just that file."""
     conversations_dir = Path(temp_storage) / "data" / "conversations"
@@ -131,7 +131,7 @@ def test_migrate_json_file_skips_unparseable_file_and_keeps_batch_going(temp_sto
     (garbage_dir / "corrupt.json").write_text("this is not { valid json at all")
 
     # No index.json written -> migrate_all_conversations falls through to
-    # the directory-scan path (_migrate_without_index -> _migrate_json_file).
+    # the directory-scan path (_migrate_without_index -> _load_conversation_file).
     migrator = ConversationMigrator(temp_storage, use_data_dir=True)
     stats = migrator.migrate_all_conversations()
 
@@ -6,14 +6,20 @@ This module tests the SQLite Full-Text Search (FTS5) implementation
 for conversation memory, including performance, accuracy, and integration.
 """
 
+import asyncio
 import json
 import shutil
+import sqlite3
 import sys
 import tempfile
+import threading
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+import conversation_memory
+import migrate_to_sqlite
 from conversation_memory import ConversationMemoryServer
 from migrate_to_sqlite import ConversationMigrator
 from search_database import SearchDatabase
@@ -105,6 +111,41 @@ class TestSearchDatabase:
         results = search_db.search_conversations("python & async")
         assert len(results) >= 0  # Should not crash
 
+    def test_search_ranking_weights_topics_over_title_and_content(self, search_db):
+        """Topic hits outrank title+content hits, as in the linear scorer."""
+        base = {"date": "2025-06-12T10:00:00", "created_at": "2025-06-12T10:00:00"}
+        search_db.add_conversation(
+            {**base, "id": "title", "title": "Kafka notes", "content": "about kafka", "topics": []},
+            "a.json",
+        )
+        search_db.add_conversation(
+            {**base, "id": "topic", "title": "Misc", "content": "brokers", "topics": ["kafka"]},
+            "b.json",
+        )
+        for i in range(5):
+            search_db.add_conversation(
+                {**base, "id": f"other_{i}", "title": "Other", "content": "text", "topics": []},
+                "c.json",
+            )
+
+        results = search_db.search_conversations("kafka")
+
+        assert [r["id"] for r in results] == ["topic", "title"]
+
+    def test_add_conversations_skips_bad_item_and_keeps_batch(self, search_db, sample_conversation):
+        """One bad row in a batch is rolled back alone; the rest is committed."""
+        second = {**sample_conversation, "id": "test_conv_002"}
+        broken = {key: value for key, value in second.items() if key != "created_at"}
+        broken["id"] = "test_conv_broken"
+
+        results = search_db.add_conversations(
+            [(sample_conversation, "a.json"), (broken, "b.json"), (second, "c.json")]
+        )
+
+        assert results == [True, False, True]
+        assert search_db.get_conversation_ids() == {"test_conv_001", "test_conv_002"}
+        assert len(search_db.search_by_topic("python")) == 2
+
     def test_search_by_topic(self, search_db, sample_conversation):
         """Test topic-based search."""
         search_db.add_conversation(sample_conversation, "test/path.json")
@@ -607,6 +648,128 @@ class TestConversationMemoryServerSQLite:
         result = await memory_server_linear.search_by_conversation_type("chat")
         assert result == [{"error": "Conversation-type search requires SQLite FTS to be enabled"}]
 
+    @pytest.mark.asyncio
+    async def test_existing_json_store_is_synced_into_search_db(
+        self, memory_server_linear, temp_storage
+    ):
+        """Opening a JSON-only store with SQLite enabled backfills search.db."""
+        await memory_server_linear.add_conversation(
+            "Kubernetes operators and custom resources", "K8s Operators"
+        )
+
+        server = ConversationMemoryServer(
+            storage_path=temp_storage, use_data_dir=True, enable_sqlite=True
+        )
+
+        # The backfill runs in the background; searches wait for it
+        results = await server.search_conversations("operators")
+        assert [r["title"] for r in results] == ["K8s Operators"]
+        assert server.search_db.get_conversation_count() == 1
+
+        # Reopening an in-sync store adds nothing
+        reopened = ConversationMemoryServer(
+            storage_path=temp_storage, use_data_dir=True, enable_sqlite=True
+        )
+        await reopened._wait_for_search_db_sync()
+        assert server.search_db.get_conversation_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_search_db_sync_skips_unchanged_failures(
+        self, memory_server_linear, temp_storage
+    ):
+        """Entries that can't be added aren't re-read until their file changes."""
+        result = await memory_server_linear.add_conversation("Broken on disk", "Broken")
+        conv_file = Path(result["file_path"])
+        good_content = conv_file.read_text()
+        conv_id = json.loads(good_content)["id"]
+        conv_file.write_text("{not json")
+
+        def open_server():
+            return ConversationMemoryServer(
+                storage_path=temp_storage, use_data_dir=True, enable_sqlite=True
+            )
+
+        server = open_server()
+        await server._wait_for_search_db_sync()
+        assert server.search_db.get_conversation_count() == 0
+        assert list(server.search_db.get_sync_failures()) == [conv_id]
+
+        with patch(
+            "conversation_memory._load_json_file", wraps=conversation_memory._load_json_file
+        ) as load:
+            await open_server()._wait_for_search_db_sync()
+        assert conv_file not in [call.args[0] for call in load.call_args_list]
+
+        # Fixing the file changes its stamp, so the next start retries it
+        conv_file.write_text(good_content)
+        server = open_server()
+        await server._wait_for_search_db_sync()
+        assert server.search_db.get_conversation_count() == 1
+        assert server.search_db.get_sync_failures() == {}
+
+    @pytest.mark.asyncio
+    async def test_search_db_sync_runs_off_the_constructor(
+        self, memory_server_linear, temp_storage
+    ):
+        """Construction returns before the backfill; searches wait for it."""
+        await memory_server_linear.add_conversation("Background sync content", "Background")
+        release = threading.Event()
+        original_add = SearchDatabase.add_conversations
+
+        def slow_add(db, items):
+            release.wait(5)
+            return original_add(db, items)
+
+        with patch.object(SearchDatabase, "add_conversations", slow_add):
+            server = ConversationMemoryServer(
+                storage_path=temp_storage, use_data_dir=True, enable_sqlite=True
+            )
+            assert server._search_db_sync_thread.is_alive()
+            search = asyncio.ensure_future(server.search_conversations("background"))
+            await asyncio.sleep(0.05)
+            assert not search.done()
+            release.set()
+            results = await search
+
+        assert [r["title"] for r in results] == ["Background"]
+
+    @pytest.mark.asyncio
+    async def test_writes_wait_for_search_db_sync(self, memory_server_linear, temp_storage):
+        """Saves during the backfill wait for it, and its stale rows don't win."""
+        await memory_server_linear.add_conversation("Original wording here", "Edited")
+        conv_id = memory_server_linear._read_json_cached(memory_server_linear.index_file)[
+            "conversations"
+        ][0]["id"]
+        release = threading.Event()
+        original_add = SearchDatabase.add_conversations
+
+        def slow_add(db, items):
+            release.wait(5)
+            return original_add(db, items)
+
+        with patch.object(SearchDatabase, "add_conversations", slow_add):
+            server = ConversationMemoryServer(
+                storage_path=temp_storage, use_data_dir=True, enable_sqlite=True
+            )
+            update = asyncio.ensure_future(
+                server.update_conversation(conv_id, content="Rewritten wording here")
+            )
+            add = asyncio.ensure_future(server.add_conversation("Fresh wording here", "New"))
+            await asyncio.sleep(0.05)
+            assert not update.done()
+            assert not add.done()
+            release.set()
+            update_result, add_result = await asyncio.gather(update, add)
+
+        assert update_result["status"] == "success"
+        assert add_result["status"] == "success"
+        assert server.search_db.get_conversation_count() == 2
+        with sqlite3.connect(server.search_db.db_path) as conn:
+            (content,) = conn.execute(
+                "SELECT content FROM conversations WHERE id = ?", (conv_id,)
+            ).fetchone()
+        assert "Rewritten wording" in content
+
 
 class TestConversationMigration:
     """Test migration from JSON to SQLite."""
@@ -678,6 +841,16 @@ class TestConversationMigration:
         results = migrator.search_db.search_conversations("python")
         assert len(results) == 3
 
+    def test_migration_spans_several_batches(self, temp_storage, monkeypatch):
+        """Batches are flushed as they fill and once more at the end."""
+        monkeypatch.setattr(migrate_to_sqlite, "ADD_CONVERSATIONS_BATCH_SIZE", 2)
+        migrator = ConversationMigrator(temp_storage, use_data_dir=True)
+
+        stats = migrator.migrate_all_conversations()
+
+        assert stats["successfully_migrated"] == 3
+        assert migrator.search_db.get_conversation_count() == 3
+
     def test_migration_verification(self, temp_storage):
         """Test migration verification."""
         migrator = ConversationMigrator(temp_storage, use_data_dir=True)
@@ -254,3 +254,12 @@ async def test_updated_at_set(server):
     await server.update_conversation(conv_id, title="x")
     data = _load(file_path)
     assert "updated_at" in data
+
+
+@pytest.mark.asyncio
+async def test_audit_line_and_updated_at_share_timestamp(server):
+    conv_id, file_path = await _seed(server)
+    await server.update_conversation(conv_id, title="x")
+    data = _load(file_path)
+    audit_timestamp = data["content"].split()[1]
+    assert data["updated_at"].startswith(audit_timestamp)